@@ -6,63 +6,102 @@ Caches deterministic operations (JSON, Base64, URL encoding).
 """
 
 import hashlib
-from collections import OrderedDict
 from typing import Optional
 
 import structlog
 
 from app.core.config import settings
+from app.core.metrics import record_cache_event
+from app.core.observability import DEBUG_LOGGING
+from app.core.redis_client import get_redis_client, redis_get, redis_set
 
 logger = structlog.get_logger("cache")
 
+# Keys per SCAN page and per pipelined UNLINK batch
+_SCAN_BATCH_SIZE = 500
+
+# Settings are frozen, so hot-path values can be bound once
+_MAX_INPUT_BYTES = settings.CACHE_MAX_INPUT_BYTES
+_REDIS_TTL_SECONDS = settings.REDIS_TTL_SECONDS
+
 
 class LRUCache:
     """
     Simple LRU (Least Recently Used) cache implementation.
     Used as fallback when Redis is unavailable.
+    Bounded by entry count and, optionally, by total key+value length.
     """
 
-    def __init__(self, max_size: int = 100):
-        self.cache: OrderedDict[str, str] = OrderedDict()
+    def __init__(self, max_size: int = 100, max_bytes: int | None = None):
+        # Plain dicts keep insertion order; the first key is the oldest
+        self.cache: dict[str, str] = {}
         self.max_size = max_size
+        self.max_bytes = max_bytes
+        self._bytes = 0
 
     def get(self, key: str) -> Optional[str]:
         """Get value from cache, returns None if not found."""
-        if key not in self.cache:
+        value = self.cache.pop(key, None)
+        if value is None:
             return None
 
-        # Move to end (most recently used)
-        self.cache.move_to_end(key)
-        return self.cache[key]
+        # Re-insert to mark as most recently used
+        self.cache[key] = value
+        return value
 
     def put(self, key: str, value: str) -> None:
-        """Put value in cache, evicting oldest if necessary."""
-        if key in self.cache:
-            # Update existing
-            self.cache.move_to_end(key)
-        else:
-            # Add new
-            if len(self.cache) >= self.max_size:
-                # Remove oldest (first item)
-                self.cache.popitem(last=False)
+        """Put value in cache, evicting oldest entries if necessary."""
+        old_value = self.cache.pop(key, None)
+        if old_value is not None:
+            self._bytes -= len(key) + len(old_value)
+
+        entry_bytes = len(key) + len(value)
+        if self.max_bytes is not None and entry_bytes > self.max_bytes:
+            # Never flush the whole cache for a single oversized entry
+            return
 
         self.cache[key] = value
+        self._bytes += entry_bytes
+
+        while self.cache and (
+            len(self.cache) > self.max_size
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            # Remove oldest (first item)
+            oldest = next(iter(self.cache))
+            self._bytes -= len(oldest) + len(self.cache.pop(oldest))
 
     def clear(self) -> None:
         """Clear all cached items."""
         self.cache.clear()
+        self._bytes = 0
 
     def size(self) -> int:
         """Return current cache size."""
         return len(self.cache)
 
 
-# Global in-memory caches for fallback
-_text_tool_caches = {
-    "json-formatter": LRUCache(max_size=settings.TEXT_TOOL_CACHE_SIZE),
-    "base64": LRUCache(max_size=settings.TEXT_TOOL_CACHE_SIZE),
-    "url-encoder": LRUCache(max_size=settings.TEXT_TOOL_CACHE_SIZE),
-}
+# Tools with an in-memory fallback cache
+_CACHED_TOOL_SLUGS = ("json-formatter", "base64", "url-encoder")
+
+# Global in-memory caches for fallback (built on first use)
+_text_tool_caches: dict[str, LRUCache] | None = None
+
+
+def _get_text_tool_caches() -> dict[str, LRUCache]:
+    """Get or create the per-tool in-memory caches."""
+    global _text_tool_caches
+
+    if _text_tool_caches is None:
+        _text_tool_caches = {
+            slug: LRUCache(
+                max_size=settings.TEXT_TOOL_CACHE_SIZE,
+                max_bytes=settings.TEXT_TOOL_CACHE_MAX_BYTES,
+            )
+            for slug in _CACHED_TOOL_SLUGS
+        }
+
+    return _text_tool_caches
 
 
 def _generate_cache_key(tool_slug: str, input_text: str, **kwargs) -> str:
@@ -75,19 +114,24 @@ def _generate_cache_key(tool_slug: str, input_text: str, **kwargs) -> str:
         **kwargs: Additional parameters (e.g., action, format)
 
     Returns:
-        MD5 hash of the combined inputs
+        16-char BLAKE2b (8-byte digest) hex of the combined inputs
     """
-    # Combine all inputs
-    key_parts = [tool_slug, input_text]
+    # Stream all parts into the hasher instead of joining them first.
+    # ASCII unit separator (0x1f) keeps user text containing "|" from
+    # colliding with the option suffix.
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(tool_slug.encode("utf-8"))
+    hasher.update(b"\x1f")
+    hasher.update(input_text.encode("utf-8"))
 
-    # Add sorted kwargs to ensure consistent keys
-    for k in sorted(kwargs.keys()):
-        key_parts.append(f"{k}={kwargs[k]}")
+    # Add kwargs in a stable order; zero or one option needs no sort
+    for k in kwargs if len(kwargs) < 2 else sorted(kwargs):
+        hasher.update(b"\x1f")
+        hasher.update(k.encode("utf-8"))
+        hasher.update(b"=")
+        hasher.update(str(kwargs[k]).encode("utf-8"))
 
-    combined = "|".join(str(p) for p in key_parts)
-
-    # Hash for compact key
-    return hashlib.md5(combined.encode()).hexdigest()
+    return hasher.hexdigest()
 
 
 def _try_redis_get(cache_key: str) -> tuple[bool, Optional[str]]:
@@ -96,8 +140,6 @@ def _try_redis_get(cache_key: str) -> tuple[bool, Optional[str]]:
     Returns (success, value) tuple.
     """
     try:
-        from app.core.redis_client import redis_get
-
         value = redis_get(f"cache:{cache_key}")
         if value is not None:
             return True, value
@@ -113,45 +155,90 @@ def _try_redis_set(cache_key: str, value: str, ttl: int = 3600) -> bool:
     Returns True if successful.
     """
     try:
-        from app.core.redis_client import redis_set
-
         return redis_set(f"cache:{cache_key}", value, ttl=ttl)
     except Exception as e:
         logger.debug("redis_cache_set_failed", error=str(e))
         return False
 
 
-def get_cached_result(tool_slug: str, input_text: str, **kwargs) -> Optional[str]:
+def make_cache_key(tool_slug: str, input_text: str, **kwargs) -> Optional[str]:
     """
-    Get cached result for text tool.
-    Tries Redis first, falls back to in-memory cache.
-
-    Args:
-        tool_slug: Tool identifier (e.g., "json-formatter")
-        input_text: Input text
-        **kwargs: Additional parameters
+    Hash the input once so a handler can reuse the key for lookup and store.
 
     Returns:
-        Cached result or None if not found
+        The cache key, or None if the input is too large to cache
     """
-    cache_key = _generate_cache_key(tool_slug, input_text, **kwargs)
+    # Large inputs almost never hit; skip hashing and the Redis round-trip
+    if len(input_text) > _MAX_INPUT_BYTES:
+        return None
+    return _generate_cache_key(tool_slug, input_text, **kwargs)
+
 
+def get_cached_by_key(tool_slug: str, cache_key: str) -> Optional[str]:
+    """
+    Get cached result for a key from make_cache_key().
+    Tries Redis first, falls back to in-memory cache.
+    Records the hit/miss in the Prometheus cache counters.
+    """
     # Try Redis first
     redis_success, redis_value = _try_redis_get(cache_key)
     if redis_success and redis_value is not None:
-        logger.debug("cache_hit", source="redis", tool=tool_slug)
+        if DEBUG_LOGGING:
+            logger.debug("cache_hit", source="redis", tool=tool_slug)
+        record_cache_event(tool_slug, hit=True)
         return redis_value
 
     # Fallback to in-memory
-    if tool_slug in _text_tool_caches:
-        memory_value = _text_tool_caches[tool_slug].get(cache_key)
+    cache = _get_text_tool_caches().get(tool_slug)
+    if cache is not None:
+        memory_value = cache.get(cache_key)
         if memory_value is not None:
-            logger.debug("cache_hit", source="memory", tool=tool_slug)
+            if DEBUG_LOGGING:
+                logger.debug("cache_hit", source="memory", tool=tool_slug)
+            record_cache_event(tool_slug, hit=True)
             return memory_value
 
+    record_cache_event(tool_slug, hit=False)
     return None
 
 
+def set_cached_by_key(tool_slug: str, cache_key: str, result: str) -> None:
+    """
+    Cache result for a key from make_cache_key().
+    Writes to both Redis and in-memory cache.
+    """
+    # Try Redis
+    redis_success = _try_redis_set(cache_key, result, ttl=_REDIS_TTL_SECONDS)
+    if redis_success and DEBUG_LOGGING:
+        logger.debug("cache_set", source="redis", tool=tool_slug)
+
+    # Always write to in-memory as fallback
+    cache = _get_text_tool_caches().get(tool_slug)
+    if cache is not None:
+        cache.put(cache_key, result)
+        if not redis_success and DEBUG_LOGGING:
+            logger.debug("cache_set", source="memory", tool=tool_slug)
+
+
+def get_cached_result(tool_slug: str, input_text: str, **kwargs) -> Optional[str]:
+    """
+    Get cached result for text tool.
+    Tries Redis first, falls back to in-memory cache.
+
+    Args:
+        tool_slug: Tool identifier (e.g., "json-formatter")
+        input_text: Input text
+        **kwargs: Additional parameters
+
+    Returns:
+        Cached result or None if not found
+    """
+    cache_key = make_cache_key(tool_slug, input_text, **kwargs)
+    if cache_key is None:
+        return None
+    return get_cached_by_key(tool_slug, cache_key)
+
+
 def set_cached_result(tool_slug: str, input_text: str, result: str, **kwargs) -> None:
     """
     Cache result for text tool.
@@ -163,18 +250,10 @@ def set_cached_result(tool_slug: str, input_text: str, result: str, **kwargs) ->
         result: Result to cache
         **kwargs: Additional parameters
     """
-    cache_key = _generate_cache_key(tool_slug, input_text, **kwargs)
-
-    # Try Redis
-    redis_success = _try_redis_set(cache_key, result, ttl=settings.REDIS_TTL_SECONDS)
-    if redis_success:
-        logger.debug("cache_set", source="redis", tool=tool_slug)
-
-    # Always write to in-memory as fallback
-    if tool_slug in _text_tool_caches:
-        _text_tool_caches[tool_slug].put(cache_key, result)
-        if not redis_success:
-            logger.debug("cache_set", source="memory", tool=tool_slug)
+    # Don't let oversized inputs evict useful small entries
+    cache_key = make_cache_key(tool_slug, input_text, **kwargs)
+    if cache_key is not None:
+        set_cached_by_key(tool_slug, cache_key, result)
 
 
 def clear_cache(tool_slug: Optional[str] = None) -> None:
@@ -185,26 +264,32 @@ def clear_cache(tool_slug: Optional[str] = None) -> None:
         tool_slug: Tool to clear cache for, or None to clear all
     """
     # Clear in-memory
-    if tool_slug and tool_slug in _text_tool_caches:
-        _text_tool_caches[tool_slug].clear()
+    caches = _get_text_tool_caches()
+    if tool_slug and tool_slug in caches:
+        caches[tool_slug].clear()
     elif tool_slug is None:
-        for cache in _text_tool_caches.values():
+        for cache in caches.values():
             cache.clear()
 
     # Clear Redis (pattern-based)
     try:
-        from app.core.redis_client import get_redis_client
-
         client = get_redis_client()
         if client:
             if tool_slug:
                 pattern = f"{settings.REDIS_KEY_PREFIX}cache:*{tool_slug}*"
             else:
                 pattern = f"{settings.REDIS_KEY_PREFIX}cache:*"
-            keys = client.keys(pattern)
-            if keys:
-                client.delete(*keys)
-                logger.info("cache_cleared", source="redis", count=len(keys))
+            # SCAN doesn't block the server like KEYS; UNLINK frees memory async
+            count = 0
+            with client.pipeline(transaction=False) as pipe:
+                for key in client.scan_iter(match=pattern, count=_SCAN_BATCH_SIZE):
+                    pipe.unlink(key)
+                    count += 1
+                    if count % _SCAN_BATCH_SIZE == 0:
+                        pipe.execute()
+                pipe.execute()
+            if count:
+                logger.info("cache_cleared", source="redis", count=count)
     except Exception as e:
         logger.warning("redis_cache_clear_failed", error=str(e))
 
@@ -217,18 +302,20 @@ def get_cache_stats() -> dict:
         Dictionary with cache stats
     """
     stats = {
-        "memory": {tool: cache.size() for tool, cache in _text_tool_caches.items()},
+        "memory": {
+            tool: cache.size() for tool, cache in _get_text_tool_caches().items()
+        },
         "redis": {"available": False, "keys": 0},
     }
 
     try:
-        from app.core.redis_client import get_redis_client
-
         client = get_redis_client()
         if client:
             stats["redis"]["available"] = True
             pattern = f"{settings.REDIS_KEY_PREFIX}cache:*"
-            stats["redis"]["keys"] = len(client.keys(pattern))
+            stats["redis"]["keys"] = sum(
+                1 for _ in client.scan_iter(match=pattern, count=_SCAN_BATCH_SIZE)
+            )
     except Exception:
         pass
 
@@ -1,7 +1,8 @@
+import logging
 from enum import Enum
 from pathlib import Path
 
-from pydantic import Field
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -24,6 +25,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,  # Validated once at startup, read-only afterwards
     )
 
     # Application Metadata
@@ -50,6 +52,9 @@ class Settings(BaseSettings):
     REDIS_TTL_SECONDS: int = Field(
         default=3600, description="Default TTL for Redis keys in seconds"
     )
+    REDIS_POOL_SIZE: int = Field(
+        default=32, description="Maximum connections in the shared Redis pool"
+    )
 
     # Security & Limits
     MAX_IMAGE_SIZE_MB: int = Field(
@@ -85,7 +90,15 @@ class Settings(BaseSettings):
         description="Default meta description for pages without specific SEO content",
     )
     TEXT_TOOL_CACHE_SIZE: int = Field(
-        default=100, description="LRU cache size for text-based tools"
+        default=10000, description="Max LRU cache entries per text-based tool"
+    )
+    TEXT_TOOL_CACHE_MAX_BYTES: int = Field(
+        default=16 * 1024 * 1024,
+        description="Max total key+value size of each text tool's LRU cache",
+    )
+    CACHE_MAX_INPUT_BYTES: int = Field(
+        default=65536,
+        description="Inputs larger than this bypass the text tool cache entirely",
     )
 
     # CORS & Trusted Hosts
@@ -116,11 +129,31 @@ class Settings(BaseSettings):
         description="Whitelist of allowed PDF MIME types",
     )
 
+    # Logging
+    LOG_LEVEL: str | None = Field(
+        default=None,
+        description="Log level name (DEBUG, INFO, ...); defaults to INFO in prod, DEBUG otherwise",
+    )
+
     # FastAPI Configuration
     DEBUG: bool = Field(default=True, description="Enable debug mode")
     DOCS_ENABLED: bool = Field(default=True, description="Enable /docs endpoint")
     REDOC_ENABLED: bool = Field(default=True, description="Enable /redoc endpoint")
 
+    @field_validator("LOG_LEVEL")
+    @classmethod
+    def _validate_log_level(cls, value: str | None) -> str | None:
+        """Normalize LOG_LEVEL and reject names the logging module doesn't know."""
+        if not value:
+            return None
+        name = value.upper()
+        if name not in logging.getLevelNamesMapping():
+            raise ValueError(
+                f"Unknown LOG_LEVEL {value!r}; expected one of "
+                + ", ".join(logging.getLevelNamesMapping())
+            )
+        return name
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Ensure temp directory exists
@@ -136,6 +169,13 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return self.ENV == Environment.PROD
 
+    @property
+    def log_level(self) -> int:
+        """Return the effective numeric log level."""
+        if self.LOG_LEVEL:
+            return logging.getLevelNamesMapping()[self.LOG_LEVEL]
+        return logging.INFO if self.is_prod else logging.DEBUG
+
     @property
     def docs_url(self) -> str | None:
         """Return docs URL based on environment and settings."""
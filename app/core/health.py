@@ -6,6 +6,8 @@ Provides health and readiness endpoints for container orchestration.
 - /ready: Readiness probe - is the app ready to serve traffic?
 """
 
+import os
+import sys
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -35,8 +37,33 @@ def get_uptime() -> float:
     return time.time() - _start_time
 
 
+# Last successful temp directory probe: (monotonic timestamp, result)
+_temp_check_cache: tuple[float, dict] | None = None
+_TEMP_CHECK_TTL_SECONDS: float = 5.0
+
+
 def check_temp_directory() -> dict:
-    """Check if temp directory is accessible."""
+    """
+    Check if temp directory is accessible.
+    Successful results are reused for a few seconds so frequent probes
+    don't write to disk every time; failures are never cached.
+    """
+    global _temp_check_cache
+
+    now = time.monotonic()
+    if (
+        _temp_check_cache is not None
+        and now - _temp_check_cache[0] < _TEMP_CHECK_TTL_SECONDS
+    ):
+        return _temp_check_cache[1]
+
+    result = _probe_temp_directory()
+    _temp_check_cache = (now, result) if result["status"] == "ok" else None
+    return result
+
+
+def _probe_temp_directory() -> dict:
+    """Write and read back a test file in the temp directory."""
     try:
         # Try to write and read a test file
         test_file = settings.TEMP_DIR / ".health_check"
@@ -52,25 +79,36 @@ def check_temp_directory() -> dict:
         return {"status": "error", "path": str(settings.TEMP_DIR), "error": str(e)}
 
 
+def _read_memory_mb_statm() -> float:
+    """Current RSS in MB from /proc/self/statm (Linux, single read)."""
+    with open("/proc/self/statm", "rb") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * _PAGE_SIZE / (1024 * 1024)
+
+
+def _read_memory_mb_rusage() -> float:
+    """Peak RSS in MB from getrusage (non-Linux fallback)."""
+    import resource
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    # On macOS, ru_maxrss is in bytes, elsewhere it's in KB
+    if sys.platform == "darwin":
+        return usage.ru_maxrss / (1024 * 1024)
+    return usage.ru_maxrss / 1024
+
+
+# Pick the memory reader once instead of branching on every probe
+if sys.platform.startswith("linux"):
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+    _read_memory_mb = _read_memory_mb_statm
+else:
+    _read_memory_mb = _read_memory_mb_rusage
+
+
 def check_memory() -> dict:
     """Check memory usage (basic check)."""
     try:
-        import resource
-
-        usage = resource.getrusage(resource.RUSAGE_SELF)
-        # Convert to MB
-        memory_mb = (
-            usage.ru_maxrss / (1024 * 1024) if hasattr(usage, "ru_maxrss") else 0
-        )
-        # On macOS, ru_maxrss is in bytes, on Linux it's in KB
-        import sys
-
-        if sys.platform == "darwin":
-            memory_mb = usage.ru_maxrss / (1024 * 1024)
-        else:
-            memory_mb = usage.ru_maxrss / 1024
-
-        return {"status": "ok", "memory_mb": round(memory_mb, 2)}
+        return {"status": "ok", "memory_mb": round(_read_memory_mb(), 2)}
     except Exception as e:
         return {"status": "unknown", "error": str(e)}
 
@@ -81,21 +119,27 @@ def check_redis() -> dict:
         return {"status": "disabled", "message": "Redis devre dışı"}
 
     try:
-        from app.core.redis_client import get_redis_client, is_redis_available
+        import redis
 
-        if not is_redis_available():
-            return {"status": "unavailable", "message": "Redis bağlantısı kurulamadı"}
+        from app.core.redis_client import get_redis_client, mark_redis_unavailable
 
         client = get_redis_client()
         if client:
-            # Test with ping
-            info = client.info("server")
+            # INFO doubles as the liveness probe; no separate PING
+            try:
+                info = client.info("server")
+            except (redis.ConnectionError, redis.TimeoutError):
+                mark_redis_unavailable()
+                return {
+                    "status": "unavailable",
+                    "message": "Redis bağlantısı kurulamadı",
+                }
             return {
                 "status": "ok",
                 "redis_version": info.get("redis_version", "unknown"),
                 "connected_clients": info.get("connected_clients", 0),
             }
-        return {"status": "unavailable", "message": "Redis client oluşturulamadı"}
+        return {"status": "unavailable", "message": "Redis bağlantısı kurulamadı"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
@@ -1,3 +1,5 @@
+import hashlib
+import itertools
 import os
 from io import BytesIO
 from pathlib import Path
@@ -9,40 +11,52 @@ from PIL import Image
 
 from app.core.config import settings
 
+# Magic-byte detection only needs the start of the file
+_MAGIC_HEADER_BYTES = 512
 
-async def load_and_validate_image(
-    file: UploadFile | None, url: str | None
-) -> tuple[Image.Image, str, int]:
-    """
-    Loads an image from a file upload or URL, validates magic bytes, and returns the PIL Image object.
-    Returns: (PIL.Image, filename, original_size_bytes)
-    """
-    image_data = b""
-    filename = "image"
+# Output names are served via /download/{filename}, so they must stay
+# unguessable. A per-process secret keys a BLAKE2b PRF over a counter,
+# avoiding a getrandom() syscall per saved image.
+_SAVE_NAME_KEY = os.urandom(16)
+_SAVE_COUNTER = itertools.count()
 
-    # 1. Get Data
-    if file:
-        image_data = await file.read()
-        filename = file.filename or "image"
-    elif url:
-        async with httpx.AsyncClient() as client:
-            try:
-                resp = await client.get(url, timeout=10.0)
-                resp.raise_for_status()
-                image_data = resp.content
-                filename = url.split("/")[-1] or "image"
-            except Exception as e:
-                raise HTTPException(
-                    status_code=400, detail=f"URL indirilemedi: {str(e)}"
-                )
-    else:
-        raise HTTPException(status_code=400, detail="Dosya veya URL gerekli.")
 
-    original_size = len(image_data)
+def _unique_token() -> str:
+    """Return an 8-char unpredictable token for temp file names."""
+    counter = next(_SAVE_COUNTER).to_bytes(8, "little")
+    return hashlib.blake2b(counter, key=_SAVE_NAME_KEY, digest_size=4).hexdigest()
+
+
+# Shared HTTP client for URL downloads (keeps connections alive)
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared async HTTP client."""
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=16),
+        )
+
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _HTTP_CLIENT
+
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
 
-    # 2. Validate Magic Bytes
+
+def _ensure_image_mime(header: bytes) -> None:
+    """Validate magic bytes of an image header, raising 400 if not an image."""
     try:
-        mime_type = puremagic.from_string(image_data, mime=True)
+        mime_type = puremagic.from_string(header, mime=True)
         if not mime_type or not mime_type.startswith("image/"):
             if mime_type is None:
                 raise ValueError("Dosya tipi tespit edilemedi.")
@@ -53,9 +67,43 @@ async def load_and_validate_image(
             detail="Geçersiz dosya formatı. Sadece geçerli resim dosyaları kabul edilir.",
         )
 
+
+async def load_and_validate_image(
+    file: UploadFile | None, url: str | None
+) -> tuple[Image.Image, str, int]:
+    """
+    Loads an image from a file upload or URL, validates magic bytes, and returns the PIL Image object.
+    Uploads are checked from a small header and then opened lazily from the
+    underlying spooled file, so rejected files are never fully buffered.
+    Returns: (PIL.Image, filename, original_size_bytes)
+    """
+    # 1. Get Data + 2. Validate Magic Bytes
+    if file:
+        filename = file.filename or "image"
+        header = await file.read(_MAGIC_HEADER_BYTES)
+        _ensure_image_mime(header)
+
+        file.file.seek(0, 2)
+        original_size = file.file.tell()
+        file.file.seek(0)
+        source = file.file
+    elif url:
+        try:
+            resp = await get_http_client().get(url)
+            resp.raise_for_status()
+            image_data = resp.content
+            filename = url.split("/")[-1] or "image"
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"URL indirilemedi: {str(e)}")
+        _ensure_image_mime(image_data[:_MAGIC_HEADER_BYTES])
+        original_size = len(image_data)
+        source = BytesIO(image_data)
+    else:
+        raise HTTPException(status_code=400, detail="Dosya veya URL gerekli.")
+
     # 3. Load into Pillow
     try:
-        img = Image.open(BytesIO(image_data))
+        img = Image.open(source)
         return img, filename, original_size
     except Exception as e:
         raise HTTPException(
@@ -63,6 +111,22 @@ async def load_and_validate_image(
         )
 
 
+# img.info entries kept by strip_metadata. Encoders re-embed much of
+# img.info on save (ICC profiles, JPEG/GIF comments, ...), so everything
+# else is dropped; palette transparency is pixel data, not metadata.
+_KEPT_INFO_KEYS = ("transparency",)
+
+
+def strip_metadata(img: Image.Image) -> Image.Image:
+    """
+    Drops EXIF/XMP/ICC, comments and other metadata so a later save()
+    writes none of it. Works in place on img.info; the pixel data is
+    left untouched.
+    """
+    img.info = {key: img.info[key] for key in _KEPT_INFO_KEYS if key in img.info}
+    return img
+
+
 def save_image(
     img: Image.Image, filename: str, target_format: str, **save_kwargs
 ) -> tuple[Path, str, int]:
@@ -73,7 +137,7 @@ def save_image(
     try:
         output_filename = f"{os.path.splitext(filename)[0]}.{target_format.lower()}"
         output_path = (
-            settings.TEMP_DIR / f"processed_{os.urandom(4).hex()}_{output_filename}"
+            settings.TEMP_DIR / f"processed_{_unique_token()}_{output_filename}"
         )
 
         img.save(output_path, format=target_format, **save_kwargs)
@@ -5,6 +5,9 @@ Provides Prometheus-compatible metrics for monitoring and alerting.
 Exposes /metrics endpoint for Prometheus scraping.
 """
 
+import re
+from functools import cache, lru_cache
+
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     Counter,
@@ -15,14 +18,23 @@ from prometheus_client import (
 
 from app.core.config import settings
 
+# /tools/{slug} optionally followed by an action path
+_TOOL_PATH_PATTERN = re.compile(r"^/tools/([^/]+)(/.*)?")
+
 # --- Application Info ---
 APP_INFO = Info("isvicre_cakisi_app", "Application information")
-APP_INFO.info(
-    {
-        "version": settings.VERSION,
-        "environment": settings.ENV.value,
-    }
-)
+
+
+@cache
+def _register_app_info() -> None:
+    """Populate APP_INFO once, on first scrape instead of at import."""
+    APP_INFO.info(
+        {
+            "version": settings.VERSION,
+            "environment": settings.ENV.value,
+        }
+    )
+
 
 # --- Request Metrics ---
 REQUEST_COUNT = Counter(
@@ -35,7 +47,7 @@ REQUEST_LATENCY = Histogram(
     "isvicre_cakisi_request_latency_seconds",
     "Request latency in seconds",
     ["method", "endpoint"],
-    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
 )
 
 # --- Tool Metrics ---
@@ -49,14 +61,14 @@ TOOL_LATENCY = Histogram(
     "isvicre_cakisi_tool_latency_seconds",
     "Tool processing latency in seconds",
     ["tool_slug"],
-    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+    buckets=(0.05, 0.25, 1.0, 5.0, 30.0),
 )
 
 TOOL_FILE_SIZE = Histogram(
     "isvicre_cakisi_tool_file_size_bytes",
     "Uploaded file size in bytes",
     ["tool_slug"],
-    buckets=(1024, 10240, 102400, 1048576, 5242880, 10485760, 26214400),  # 1KB to 25MB
+    buckets=(1 << 10, 1 << 14, 1 << 18, 1 << 22, 1 << 24),  # 1KB to 16MB
 )
 
 # --- Cache Metrics ---
@@ -87,6 +99,36 @@ SECURITY_EVENTS = Counter(
 )
 
 
+# --- Bound label children ---
+# .labels() hashes the label values on every call; label sets here are
+# small and fixed, so cache the bound child per combination.
+
+
+@lru_cache(maxsize=256)
+def _request_count(method: str, endpoint: str, status: str):
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+
+
+@lru_cache(maxsize=256)
+def _request_latency(method: str, endpoint: str):
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def _tool_calls(tool_slug: str, status: str):
+    return TOOL_CALLS.labels(tool_slug=tool_slug, status=status)
+
+
+@lru_cache(maxsize=256)
+def _tool_latency(tool_slug: str):
+    return TOOL_LATENCY.labels(tool_slug=tool_slug)
+
+
+@lru_cache(maxsize=256)
+def _tool_file_size(tool_slug: str):
+    return TOOL_FILE_SIZE.labels(tool_slug=tool_slug)
+
+
 def record_request(method: str, endpoint: str, status: int, duration: float) -> None:
     """
     Record an HTTP request for Prometheus metrics.
@@ -99,17 +141,11 @@ def record_request(method: str, endpoint: str, status: int, duration: float) ->
     """
     # Normalize endpoint to avoid high cardinality
     normalized_endpoint = normalize_endpoint(endpoint)
-    REQUEST_COUNT.labels(
-        method=method, endpoint=normalized_endpoint, status=str(status)
-    ).inc()
-    REQUEST_LATENCY.labels(method=method, endpoint=normalized_endpoint).observe(
-        duration
-    )
+    _request_count(method, normalized_endpoint, str(status)).inc()
+    _request_latency(method, normalized_endpoint).observe(duration)
 
 
-def record_tool_call(
-    tool_slug: str, status: str, duration_seconds: float, file_size: int | None = None
-) -> None:
+def record_tool_call(tool_slug: str, status: str, duration_seconds: float) -> None:
     """
     Record a tool API call for Prometheus metrics.
 
@@ -117,12 +153,25 @@ def record_tool_call(
         tool_slug: Tool identifier
         status: "success" or "error"
         duration_seconds: Processing duration in seconds
-        file_size: Optional file size in bytes
     """
-    TOOL_CALLS.labels(tool_slug=tool_slug, status=status).inc()
-    TOOL_LATENCY.labels(tool_slug=tool_slug).observe(duration_seconds)
-    if file_size is not None:
-        TOOL_FILE_SIZE.labels(tool_slug=tool_slug).observe(file_size)
+    _tool_calls(tool_slug, status).inc()
+    _tool_latency(tool_slug).observe(duration_seconds)
+
+
+def record_tool_call_with_size(
+    tool_slug: str, status: str, duration_seconds: float, file_size: int
+) -> None:
+    """
+    Record a file-based tool API call, including the upload size.
+
+    Args:
+        tool_slug: Tool identifier
+        status: "success" or "error"
+        duration_seconds: Processing duration in seconds
+        file_size: File size in bytes
+    """
+    record_tool_call(tool_slug, status, duration_seconds)
+    _tool_file_size(tool_slug).observe(file_size)
 
 
 def record_cache_event(tool_slug: str, hit: bool) -> None:
@@ -171,22 +220,25 @@ def normalize_endpoint(endpoint: str) -> str:
         Normalized endpoint path
     """
     # Remove query parameters
-    endpoint = endpoint.split("?")[0]
+    return _normalize_path(endpoint.partition("?")[0])
+
 
+@lru_cache(maxsize=1024)
+def _normalize_path(path: str) -> str:
+    """Normalize a query-free path (memoized; the route set is small)."""
     # Known tool paths - normalize to /tools/{slug}
-    if endpoint.startswith("/tools/"):
-        parts = endpoint.split("/")
-        if len(parts) >= 3:
-            tool_slug = parts[2]
-            if len(parts) > 3:
-                return f"/tools/{tool_slug}/action"
-            return f"/tools/{tool_slug}"
+    match = _TOOL_PATH_PATTERN.match(path)
+    if match:
+        tool_slug, rest = match.groups()
+        if rest is not None:
+            return f"/tools/{tool_slug}/action"
+        return f"/tools/{tool_slug}"
 
     # Static files
-    if endpoint.startswith("/static/"):
+    if path.startswith("/static/"):
         return "/static/{file}"
 
-    return endpoint
+    return path
 
 
 def get_metrics() -> bytes:
@@ -196,6 +248,7 @@ def get_metrics() -> bytes:
     Returns:
         Prometheus metrics in text format
     """
+    _register_app_info()
     return generate_latest()
 
 
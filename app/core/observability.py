@@ -5,11 +5,15 @@ Provides centralized logging and metrics collection.
 v0.9.0: Migrated to structlog for structured async-aware logging.
 """
 
+import logging
+import threading
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 from contextlib import contextmanager
+from dataclasses import dataclass
 from typing import Any, Dict
 
+import orjson
 import structlog
 
 from app.core.config import settings
@@ -32,15 +36,16 @@ def configure_logging() -> None:
 
     if settings.is_prod:
         # Production: JSON logging for log aggregators (ELK, Loki, etc.)
+        # orjson renders straight to bytes, written without a str round-trip
         structlog.configure(
             processors=shared_processors
             + [
                 structlog.processors.format_exc_info,
-                structlog.processors.JSONRenderer(),
+                structlog.processors.JSONRenderer(serializer=orjson.dumps),
             ],
-            wrapper_class=structlog.make_filtering_bound_logger(20),  # INFO level
+            wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
             context_class=dict,
-            logger_factory=structlog.PrintLoggerFactory(),
+            logger_factory=structlog.BytesLoggerFactory(),
             cache_logger_on_first_use=True,
         )
     else:
@@ -50,7 +55,7 @@ def configure_logging() -> None:
             + [
                 structlog.dev.ConsoleRenderer(colors=True),
             ],
-            wrapper_class=structlog.make_filtering_bound_logger(10),  # DEBUG level
+            wrapper_class=structlog.make_filtering_bound_logger(settings.log_level),
             context_class=dict,
             logger_factory=structlog.PrintLoggerFactory(),
             cache_logger_on_first_use=True,
@@ -60,29 +65,73 @@ def configure_logging() -> None:
 # Initialize structlog on module import
 configure_logging()
 
+
 # Get our logger
 logger = structlog.get_logger("isvicre-cakisi")
 
+# True when debug events are emitted. Settings are frozen, so modules can
+# check this flag and skip building debug event kwargs when it is off.
+DEBUG_LOGGING = settings.log_level <= logging.DEBUG
+
+
+@dataclass(slots=True)
+class ToolStats:
+    """In-memory usage counters for one tool"""
+
+    calls: int = 0
+    successes: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    rate_limits: int = 0
+    total_duration_ms: float = 0.0
+    last_error: Dict[str, Any] | None = None
+
+
 # In-memory statistics for admin dashboard (Phase 6)
-_stats = {
-    "tool_calls": defaultdict(int),  # tool_slug -> count
-    "successes": defaultdict(int),  # tool_slug -> count
-    "errors": defaultdict(int),  # tool_slug -> count
-    "cache_hits": defaultdict(int),  # tool_slug -> count
-    "rate_limit_events": defaultdict(int),  # tool_slug -> count
-    "total_duration_ms": defaultdict(float),  # tool_slug -> total ms
-    "last_error": {},  # tool_slug -> error_detail
-}
+# One record per tool, so an update or a dashboard row is one lookup
+_per_tool: Dict[str, ToolStats] = {}
+
+# Guards _per_tool updates so threadpool callers can't lose increments
+_stats_lock = threading.Lock()
+
+# Bumped on every stats write; get_stats reuses its last result while the
+# version is unchanged, so an idle dashboard poll doesn't rebuild it
+_stats_version = 0
+_stats_snapshot: tuple[int, Dict[str, Any]] | None = None
 
 # v0.7.0: In-memory analytics store
-_analytics = {
+# Queries and flows are counted as they arrive, so the dashboard never
+# rescans their full history.
+_analytics: Dict[str, Any] = {
     "page_views": defaultdict(int),  # {tool_slug: count}
-    "search_queries": [],  # List of search queries
+    "search_queries": Counter(),  # {query: count}
+    "total_searches": 0,
     # v0.8.0: Tool flow tracking
-    "tool_flows": [],  # List of (from_slug, to_slug) tuples
+    "tool_flows": Counter(),  # {(from_slug, to_slug): count}
+    "total_flows": 0,
 }
 
 
+def _get_tool_stats(tool_slug: str) -> ToolStats:
+    """Return the counters for a tool, creating them on first sight."""
+    stats = _per_tool.get(tool_slug)
+    if stats is None:
+        stats = _per_tool[tool_slug] = ToolStats()
+    return stats
+
+
+def init_stats(known_slugs: list[str]) -> None:
+    """
+    Pre-create counters for tools known at startup.
+
+    Args:
+        known_slugs: Tool slugs from the tool registry
+    """
+    with _stats_lock:
+        for slug in known_slugs:
+            _get_tool_stats(slug)
+
+
 def log_tool_call(
     tool_slug: str,
     status: str,
@@ -98,29 +147,37 @@ def log_tool_call(
         duration_ms: Duration in milliseconds
         meta: Optional metadata like action, size, error message
     """
-    # Update in-memory stats
-    _stats["tool_calls"][tool_slug] += 1
-    _stats["total_duration_ms"][tool_slug] += duration_ms
-
-    if meta and meta.get("cached"):
-        _stats["cache_hits"][tool_slug] += 1
-
     log_data = {
         "tool": tool_slug,
         "duration_ms": round(duration_ms, 2),
         **(meta or {}),
     }
+    success = status == "success"
+
+    # Update in-memory stats; the lock only covers the dict updates
+    global _stats_version
+    with _stats_lock:
+        _stats_version += 1
+        stats = _get_tool_stats(tool_slug)
+        stats.calls += 1
+        stats.total_duration_ms += duration_ms
+
+        if meta and meta.get("cached"):
+            stats.cache_hits += 1
+
+        if success:
+            stats.successes += 1
+        else:
+            stats.errors += 1
+            stats.last_error = {
+                "tool": tool_slug,
+                "status": status,
+                **log_data,
+            }
 
-    if status == "success":
-        _stats["successes"][tool_slug] += 1
+    if success:
         logger.info("tool_call", status="success", **log_data)
     else:
-        _stats["errors"][tool_slug] += 1
-        _stats["last_error"][tool_slug] = {
-            "tool": tool_slug,
-            "status": status,
-            **log_data,
-        }
         logger.error("tool_call", status="error", **log_data)
 
 
@@ -132,19 +189,19 @@ def log_security_event(event_type: str, detail: Dict[str, Any] | None = None) ->
         event_type: Type of security event (e.g., "invalid_file", "rate_limit")
         detail: Additional details about the event
     """
-    log_data = detail.copy() if detail else {}
-
     # Track rate limits per tool if tool info is available
     if event_type == "rate_limit_exceeded" and detail and "path" in detail:
-        path = detail["path"]
-        if "/tools/" in path:
-            try:
-                tool_slug = path.split("/tools/")[1].split("/")[0]
-                _stats["rate_limit_events"][tool_slug] += 1
-            except IndexError:
-                pass
+        _, sep, rest = detail["path"].partition("/tools/")
+        if sep:
+            tool_slug = rest.partition("/")[0]
+            global _stats_version
+            with _stats_lock:
+                _stats_version += 1
+                _get_tool_stats(tool_slug).rate_limits += 1
 
-    logger.warning("security_event", event_type=event_type, **log_data)
+    # ** unpacking already builds a fresh kwargs dict; no copy needed.
+    # The timestamp comes from the TimeStamper processor.
+    logger.warning("security_event", event_type=event_type, **(detail or {}))
 
 
 @contextmanager
@@ -157,7 +214,7 @@ def track_tool_call(tool_slug: str, meta: Dict[str, Any] | None = None):
             # Do work
             pass
     """
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
     exception_occurred = None
 
     try:
@@ -166,7 +223,7 @@ def track_tool_call(tool_slug: str, meta: Dict[str, Any] | None = None):
         exception_occurred = e
         raise
     finally:
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.monotonic_ns() - start_ns) / 1e6
         status = "error" if exception_occurred else "success"
 
         call_meta = meta.copy() if meta else {}
@@ -181,17 +238,35 @@ def get_stats() -> Dict[str, Any]:
     Get current statistics for admin dashboard.
 
     Returns:
-        Dictionary with tool usage statistics
+        Dictionary with tool usage statistics (shared; treat as read-only)
     """
-    total_calls = sum(_stats["tool_calls"].values())
-    total_errors = sum(_stats["errors"].values())
-    total_cache_hits = sum(_stats["cache_hits"].values())
-    total_rate_limits = sum(_stats["rate_limit_events"].values())
+    global _stats_snapshot
+
+    # Snapshot under the lock so concurrent inserts can't break iteration
+    with _stats_lock:
+        version = _stats_version
+        if _stats_snapshot is not None and _stats_snapshot[0] == version:
+            return _stats_snapshot[1]
+        per_tool = list(_per_tool.items())
+
+    stats = _build_stats(per_tool)
+    # A write racing the build bumps the version, so the next call rebuilds
+    _stats_snapshot = (version, stats)
+    return stats
+
+
+def _build_stats(per_tool: list[tuple[str, ToolStats]]) -> Dict[str, Any]:
+    """Build the dashboard payload from (slug, ToolStats) pairs."""
+    total_calls = sum(st.calls for _, st in per_tool)
+    total_errors = sum(st.errors for _, st in per_tool)
+    total_cache_hits = sum(st.cache_hits for _, st in per_tool)
+    total_rate_limits = sum(st.rate_limits for _, st in per_tool)
+
+    # Tools pre-registered by init_stats but never called are left out
+    called = [(slug, st) for slug, st in per_tool if st.calls]
 
     # Calculate top 3 tools
-    top_tools = sorted(_stats["tool_calls"].items(), key=lambda x: x[1], reverse=True)[
-        :3
-    ]
+    top_tools = sorted(called, key=lambda x: x[1].calls, reverse=True)[:3]
 
     return {
         "total_calls": total_calls,
@@ -201,42 +276,28 @@ def get_stats() -> Dict[str, Any]:
         "error_rate": (
             round(total_errors / total_calls * 100, 2) if total_calls > 0 else 0
         ),
-        "top_tools": [{"slug": slug, "calls": count} for slug, count in top_tools],
+        "top_tools": [{"slug": slug, "calls": st.calls} for slug, st in top_tools],
         "by_tool": {
-            tool_slug: {
-                "calls": _stats["tool_calls"][tool_slug],
-                "successes": _stats["successes"][tool_slug],
-                "errors": _stats["errors"][tool_slug],
-                "cache_hits": _stats["cache_hits"][tool_slug],
-                "rate_limits": _stats["rate_limit_events"][tool_slug],
-                "avg_duration_ms": (
-                    round(
-                        _stats["total_duration_ms"][tool_slug]
-                        / _stats["tool_calls"][tool_slug],
-                        2,
-                    )
-                    if _stats["tool_calls"][tool_slug] > 0
-                    else 0
-                ),
-                "last_error": _stats["last_error"].get(tool_slug),
+            slug: {
+                "calls": st.calls,
+                "successes": st.successes,
+                "errors": st.errors,
+                "cache_hits": st.cache_hits,
+                "rate_limits": st.rate_limits,
+                "avg_duration_ms": round(st.total_duration_ms / st.calls, 2),
+                "last_error": st.last_error,
             }
-            for tool_slug in _stats["tool_calls"].keys()
+            for slug, st in called
         },
     }
 
 
 def reset_stats() -> None:
     """Reset statistics (useful for testing)."""
-    global _stats
-    _stats = {
-        "tool_calls": defaultdict(int),
-        "successes": defaultdict(int),
-        "errors": defaultdict(int),
-        "cache_hits": defaultdict(int),
-        "rate_limit_events": defaultdict(int),
-        "total_duration_ms": defaultdict(float),
-        "last_error": {},
-    }
+    global _stats_version
+    with _stats_lock:
+        _stats_version += 1
+        _per_tool.clear()
 
 
 # --- v0.7.0: Analytics Functions ---
@@ -254,7 +315,10 @@ def record_page_view(
         referer: Optional referer URL
     """
     _analytics["page_views"][tool_slug] += 1
-    logger.debug("page_view", tool=tool_slug, user_agent=user_agent, referer=referer)
+    if DEBUG_LOGGING:
+        logger.debug(
+            "page_view", tool=tool_slug, user_agent=user_agent, referer=referer
+        )
 
 
 def record_search_query(query: str) -> None:
@@ -264,9 +328,12 @@ def record_search_query(query: str) -> None:
     Args:
         query: Search query string (minimum 2 characters)
     """
-    if len(query.strip()) >= 2:
-        _analytics["search_queries"].append(query.strip())
-        logger.debug("search_query", query=query.strip())
+    query = query.strip()
+    if len(query) >= 2:
+        _analytics["search_queries"][query] += 1
+        _analytics["total_searches"] += 1
+        if DEBUG_LOGGING:
+            logger.debug("search_query", query=query)
 
 
 def get_analytics_stats() -> Dict[str, Any]:
@@ -276,8 +343,6 @@ def get_analytics_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with page view and search query statistics
     """
-    from collections import Counter
-
     total_page_views = sum(_analytics["page_views"].values())
 
     # Top 10 most viewed tools
@@ -286,12 +351,12 @@ def get_analytics_stats() -> Dict[str, Any]:
     )[:10]
 
     # Top 10 search queries
-    query_counter = Counter(_analytics["search_queries"])
+    query_counter = _analytics["search_queries"]
     top_searches = query_counter.most_common(10)
 
     return {
         "total_page_views": total_page_views,
-        "total_searches": len(_analytics["search_queries"]),
+        "total_searches": _analytics["total_searches"],
         "unique_searches": len(query_counter),
         "top_viewed_tools": [
             {"slug": slug, "views": count} for slug, count in top_viewed
@@ -302,7 +367,7 @@ def get_analytics_stats() -> Dict[str, Any]:
         "page_views_by_tool": dict(_analytics["page_views"]),
         # v0.8.0: Flow statistics
         "top_flows": get_flow_stats()["top_flows"],
-        "total_flows": len(_analytics["tool_flows"]),
+        "total_flows": _analytics["total_flows"],
     }
 
 
@@ -317,7 +382,8 @@ def record_tool_flow(from_tool_slug: str, to_tool_slug: str) -> None:
     Used to track which tools users navigate between, helping
     identify common workflows and improve suggestions.
     """
-    _analytics["tool_flows"].append((from_tool_slug, to_tool_slug))
+    _analytics["tool_flows"][(from_tool_slug, to_tool_slug)] += 1
+    _analytics["total_flows"] += 1
 
 
 def get_flow_stats() -> Dict[str, Any]:
@@ -327,14 +393,11 @@ def get_flow_stats() -> Dict[str, Any]:
     Returns:
         Dictionary with top tool flows and counts
     """
-    from collections import Counter
-
     # Handle empty flows gracefully
     if not _analytics.get("tool_flows"):
         return {"top_flows": []}
 
-    flow_counter = Counter(_analytics["tool_flows"])
-    top_flows = flow_counter.most_common(10)
+    top_flows = _analytics["tool_flows"].most_common(10)
 
     return {
         "top_flows": [
@@ -349,6 +412,8 @@ def reset_analytics() -> None:
     global _analytics
     _analytics = {
         "page_views": defaultdict(int),
-        "search_queries": [],
-        "tool_flows": [],  # v0.8.0
+        "search_queries": Counter(),
+        "total_searches": 0,
+        "tool_flows": Counter(),  # v0.8.0
+        "total_flows": 0,
     }
@@ -5,8 +5,11 @@ Enables tools to pass output files to other tools via a secure,
 time-limited pipeline mechanism with cryptographic IDs.
 """
 
+import heapq
 import os
 import secrets
+import shutil
+import tempfile
 import time
 from dataclasses import dataclass
 from datetime import datetime
@@ -14,7 +17,7 @@ from pathlib import Path
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PipelineFile:
     """Metadata for a pipeline file"""
 
@@ -24,15 +27,26 @@ class PipelineFile:
     mime_type: str
     created_at: float  # Unix timestamp
     ttl_seconds: int
+    expires_at_ns: int  # time.monotonic_ns() deadline
     original_name: str = ""
 
 
 # In-memory pipeline store
 _pipeline_store: Dict[str, PipelineFile] = {}
 
+# (expires_at_ns, pipeline_id) min-heap; entries for already-removed IDs
+# are skipped when popped
+_expiry_heap: list[tuple[int, str]] = []
+
+# Upper bound on live pipeline files; the soonest-expiring go first
+_MAX_PIPELINE_FILES = 10_000
+
 # Pipeline storage directory
 _PIPELINE_DIR: Path | None = None
 
+# FICLONE ioctl from linux/fs.h (copy-on-write clone on btrfs/xfs)
+_FICLONE = 0x40049409
+
 
 def _get_pipeline_dir() -> Path:
     """Get or create the pipeline storage directory"""
@@ -40,8 +54,6 @@ def _get_pipeline_dir() -> Path:
 
     if _PIPELINE_DIR is None:
         # Use system temp directory + our subdirectory
-        import tempfile
-
         base_temp = Path(tempfile.gettempdir())
         _PIPELINE_DIR = base_temp / "isvicre-cakisi-pipeline"
         _PIPELINE_DIR.mkdir(parents=True, exist_ok=True)
@@ -51,19 +63,46 @@ def _get_pipeline_dir() -> Path:
 
 def _generate_pipeline_id() -> str:
     """Generate a cryptographically secure pipeline ID"""
-    return secrets.token_urlsafe(32)
+    # 192 random bits as hex: URL- and filename-safe without base64 work
+    return secrets.token_hex(24)
 
 
 def _is_expired(metadata: PipelineFile) -> bool:
     """Check if a pipeline file has expired based on TTL"""
-    age = time.time() - metadata.created_at
-    return age > metadata.ttl_seconds
+    return time.monotonic_ns() > metadata.expires_at_ns
+
+
+def _clone_or_copy(src: str, dst: Path) -> None:
+    """
+    Place src at dst without copying data when the filesystem allows it.
+
+    Tries a hardlink, then a copy-on-write reflink, then a regular copy.
+    Tool outputs are not modified after being pipelined, so sharing the
+    inode with the source is safe.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass  # Cross-device or links unsupported
+
+    try:
+        import fcntl
+
+        with open(src, "rb") as src_f, open(dst, "wb") as dst_f:
+            fcntl.ioctl(dst_f.fileno(), _FICLONE, src_f.fileno())
+        return
+    except (ImportError, OSError):
+        pass  # No reflink support; copy2 overwrites the empty dst
+
+    shutil.copy2(src, dst)
 
 
 def create_pipeline_file(
     source_tool_slug: str,
     input_file_path: str,
     mime_type: str,
+    *,
     ttl_seconds: int = 600,
     original_name: str = "",
 ) -> str:
@@ -85,7 +124,10 @@ def create_pipeline_file(
         - Files are stored in a dedicated temp directory
         - TTL enforced on every resolve
     """
-    import shutil
+    # Reap expired entries and make room, so the store stays bounded
+    # even if nothing else ever calls cleanup
+    cleanup_expired_pipeline_files()
+    _evict_for_new_entry()
 
     # Generate secure ID
     pipeline_id = _generate_pipeline_id()
@@ -97,10 +139,8 @@ def create_pipeline_file(
     pipeline_dir = _get_pipeline_dir()
     pipeline_file_path = pipeline_dir / f"{pipeline_id}{ext}"
 
-    # Copy file to pipeline storage
-    shutil.copy2(input_file_path, pipeline_file_path)
-
-    # Store metadata
+    # Build metadata first, so a bad argument fails before anything is
+    # written to the pipeline directory
     metadata = PipelineFile(
         pipeline_id=pipeline_id,
         file_path=str(pipeline_file_path),
@@ -108,10 +148,20 @@ def create_pipeline_file(
         mime_type=mime_type,
         created_at=time.time(),
         ttl_seconds=ttl_seconds,
+        expires_at_ns=time.monotonic_ns() + ttl_seconds * 1_000_000_000,
         original_name=original_name or Path(input_file_path).name,
     )
 
+    # Link (or clone/copy) file into pipeline storage; don't leave a
+    # partial, untracked file behind if that fails
+    try:
+        _clone_or_copy(input_file_path, pipeline_file_path)
+    except Exception:
+        pipeline_file_path.unlink(missing_ok=True)
+        raise
+
     _pipeline_store[pipeline_id] = metadata
+    heapq.heappush(_expiry_heap, (metadata.expires_at_ns, pipeline_id))
 
     return pipeline_id
 
@@ -128,6 +178,9 @@ def resolve_pipeline_file(pipeline_id: str) -> Dict[str, any] | None:
 
     Note:
         Expired files are automatically cleaned up during resolve.
+        The file itself is not stat'ed; if it was deleted externally,
+        opening file_path raises FileNotFoundError and the caller should
+        drop the entry with discard_pipeline_file().
     """
     # Check if exists in store
     if pipeline_id not in _pipeline_store:
@@ -141,12 +194,6 @@ def resolve_pipeline_file(pipeline_id: str) -> Dict[str, any] | None:
         _cleanup_pipeline_file(pipeline_id, metadata)
         return None
 
-    # Check if file still exists
-    if not os.path.exists(metadata.file_path):
-        # File was deleted externally, cleanup metadata
-        del _pipeline_store[pipeline_id]
-        return None
-
     # Return metadata as dict
     return {
         "pipeline_id": metadata.pipeline_id,
@@ -159,20 +206,40 @@ def resolve_pipeline_file(pipeline_id: str) -> Dict[str, any] | None:
     }
 
 
+def discard_pipeline_file(pipeline_id: str) -> None:
+    """
+    Drop a pipeline entry before its TTL, e.g. when its file has gone missing.
+
+    Args:
+        pipeline_id: The pipeline identifier
+    """
+    metadata = _pipeline_store.get(pipeline_id)
+    if metadata is not None:
+        _cleanup_pipeline_file(pipeline_id, metadata)
+
+
 def _cleanup_pipeline_file(pipeline_id: str, metadata: PipelineFile) -> None:
     """Internal helper to cleanup a single pipeline file"""
-    # Remove file if exists
-    if os.path.exists(metadata.file_path):
-        try:
-            os.remove(metadata.file_path)
-        except OSError:
-            pass  # File might be in use, will be caught next cleanup
+    # Remove file; a single unlink, no exists() probe first
+    try:
+        Path(metadata.file_path).unlink(missing_ok=True)
+    except OSError:
+        pass  # File might be in use, will be caught next cleanup
 
     # Remove from store
     if pipeline_id in _pipeline_store:
         del _pipeline_store[pipeline_id]
 
 
+def _evict_for_new_entry() -> None:
+    """Drop the soonest-expiring files until there is room for one more."""
+    while len(_pipeline_store) >= _MAX_PIPELINE_FILES and _expiry_heap:
+        _, pipeline_id = heapq.heappop(_expiry_heap)
+        metadata = _pipeline_store.get(pipeline_id)
+        if metadata is not None:
+            _cleanup_pipeline_file(pipeline_id, metadata)
+
+
 def cleanup_expired_pipeline_files() -> int:
     """
     Clean up all expired pipeline files.
@@ -182,20 +249,23 @@ def cleanup_expired_pipeline_files() -> int:
 
     Note:
         This can be called periodically or on-demand.
-        Currently called during app shutdown or manually.
+        Also runs on every create_pipeline_file call.
+        Only pops expired heap entries, so it costs nothing when
+        nothing has expired.
     """
-    expired_ids = []
+    now = time.monotonic_ns()
+    cleaned = 0
 
-    # Find expired files
-    for pipeline_id, metadata in _pipeline_store.items():
-        if _is_expired(metadata):
-            expired_ids.append((pipeline_id, metadata))
+    while _expiry_heap and _expiry_heap[0][0] < now:
+        _, pipeline_id = heapq.heappop(_expiry_heap)
+        metadata = _pipeline_store.get(pipeline_id)
+        if metadata is None:
+            continue  # Already removed by resolve
 
-    # Cleanup
-    for pipeline_id, metadata in expired_ids:
         _cleanup_pipeline_file(pipeline_id, metadata)
+        cleaned += 1
 
-    return len(expired_ids)
+    return cleaned
 
 
 def get_pipeline_stats() -> Dict[str, any]:
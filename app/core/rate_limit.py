@@ -4,8 +4,9 @@ Implements IP-based rate limiting with Redis support for distributed environment
 Falls back to in-memory storage when Redis is unavailable.
 """
 
+import threading
 import time
-from collections import defaultdict, deque
+from collections import defaultdict
 from typing import Optional
 
 import structlog
@@ -13,10 +14,34 @@ from fastapi import HTTPException, Request
 
 from app.core.config import settings
 from app.core.observability import log_security_event
+from app.core.redis_client import get_redis_client, redis_incr, redis_unlink_matching
 
 logger = structlog.get_logger()
 
 
+# In-memory request windows are split across shards by IP hash so each
+# lookup only locks a small dict (must be a power of two)
+_SHARD_COUNT = 16
+
+# Same fixed windows the Redis counters use (60s / 1h TTLs), on the
+# monotonic clock so wall-clock jumps can't shift them
+_REQUEST_WINDOW_NS = 60 * 1_000_000_000
+_UPLOAD_WINDOW_NS = 3600 * 1_000_000_000
+
+# SCAN page size hint for admin/reset key sweeps
+_SCAN_COUNT = 1000
+
+
+class _RequestWindow:
+    """Request count for one IP in its current fixed window."""
+
+    __slots__ = ("count", "window_start")
+
+    def __init__(self, window_start: int):
+        self.count = 0
+        self.window_start = window_start
+
+
 class RateLimiter:
     """
     Rate limiter with Redis support for distributed deployments.
@@ -24,92 +49,83 @@ class RateLimiter:
     """
 
     def __init__(self):
+        # Settings are frozen, so limits are bound once per limiter
+        self._max_requests = settings.MAX_REQUESTS_PER_MINUTE
+        self._max_upload_mb = settings.MAX_UPLOAD_MB_PER_HOUR
+        self._max_upload_bytes = self._max_upload_mb * 1024 * 1024
+        # Limits are skipped in dev mode when configured very high
+        self._skip_requests = settings.is_dev and self._max_requests > 1000
+        self._skip_uploads = settings.is_dev and self._max_upload_mb > 10000
+
         # In-memory fallback stores
-        self._request_times: dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        self._request_shards: list[dict[str, _RequestWindow]] = [
+            {} for _ in range(_SHARD_COUNT)
+        ]
+        self._shard_locks = [threading.Lock() for _ in range(_SHARD_COUNT)]
         self._upload_bytes: dict[str, dict[str, int | float]] = defaultdict(
-            lambda: {"bytes": 0, "window_start": time.time()}
+            lambda: {"bytes": 0, "window_start": time.monotonic_ns()}
         )
 
-    def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request, considering proxies."""
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-
-        if request.client:
-            return request.client.host
-
-        return "unknown"
-
-    def _get_redis_request_count(self, ip: str) -> Optional[int]:
-        """Get request count from Redis. Returns None if Redis unavailable."""
-        try:
-            from app.core.redis_client import redis_get
-
-            key = f"ratelimit:requests:{ip}"
-            value = redis_get(key)
-            if value is not None:
-                return int(value)
-            return 0
-        except Exception as e:
-            logger.debug("redis_ratelimit_get_failed", error=str(e))
-            return None
-
-    def _increment_redis_request_count(self, ip: str) -> bool:
-        """Increment request count in Redis. Returns True if successful."""
-        try:
-            from app.core.redis_client import redis_incr
-
-            key = f"ratelimit:requests:{ip}"
-            redis_incr(key, ttl=60)  # 60 second window
-            return True
-        except Exception as e:
-            logger.debug("redis_ratelimit_incr_failed", error=str(e))
-            return False
-
-    def _get_redis_upload_bytes(self, ip: str) -> Optional[int]:
-        """Get upload bytes from Redis. Returns None if Redis unavailable."""
-        try:
-            from app.core.redis_client import redis_get
-
-            key = f"ratelimit:upload:{ip}"
-            value = redis_get(key)
-            if value is not None:
-                return int(value)
-            return 0
-        except Exception as e:
-            logger.debug("redis_upload_get_failed", error=str(e))
-            return None
-
-    def _increment_redis_upload_bytes(self, ip: str, bytes_count: int) -> bool:
-        """Increment upload bytes in Redis. Returns True if successful."""
-        try:
-            from app.core.redis_client import redis_get, redis_incr
-
-            key = f"ratelimit:upload:{ip}"
-            current = redis_get(key)
-            if current is None:
-                # First upload in window, set with expiry
-                redis_incr(key, amount=bytes_count, ttl=3600)  # 1 hour window
-            else:
-                redis_incr(key, amount=bytes_count)
-            return True
-        except Exception as e:
-            logger.debug("redis_upload_incr_failed", error=str(e))
-            return False
+    def _incr_redis_request_count(self, ip: str) -> Optional[int]:
+        """
+        Count this request in Redis and return the window total.
+        Returns None if Redis unavailable.
+        """
+        # INCR returns the post-increment count; one round trip
+        return redis_incr(f"ratelimit:requests:{ip}", ttl=60)  # 60 second window
+
+    def _incr_redis_upload_bytes(self, ip: str, bytes_count: int) -> Optional[int]:
+        """
+        Add upload bytes in Redis and return the window total.
+        Returns None if Redis unavailable.
+        """
+        key = f"ratelimit:upload:{ip}"
+        return redis_incr(key, amount=bytes_count, ttl=3600)  # 1 hour window
+
+    def _release_redis_upload_bytes(self, ip: str, bytes_count: int) -> None:
+        """Take back bytes counted for an upload that was rejected."""
+        redis_incr(f"ratelimit:upload:{ip}", amount=-bytes_count)
 
     def _get_client_ip(self, request: Request) -> str:
-        """Extract client IP from request, considering proxies."""
+        """
+        Extract client IP from request, considering proxies.
+        Parsed once per request and kept on request.state, which the
+        rate and upload checks share.
+        """
+        state = request.state
+        ip = getattr(state, "client_ip", None)
+        if ip is not None:
+            return ip
+
         # Check X-Forwarded-For header first (for proxies)
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            return forwarded.split(",")[0].strip()
-
+            ip = forwarded.split(",", 1)[0].strip()
         # Fall back to direct client
-        if request.client:
-            return request.client.host
-
-        return "unknown"
+        elif request.client:
+            ip = request.client.host
+        else:
+            ip = "unknown"
+
+        state.client_ip = ip
+        return ip
+
+    def _get_request_shard(
+        self, ip: str
+    ) -> tuple[dict[str, _RequestWindow], threading.Lock]:
+        """Return the request-window shard and its lock for an IP."""
+        index = hash(ip) & (_SHARD_COUNT - 1)
+        return self._request_shards[index], self._shard_locks[index]
+
+    def tracked_ip_count(self) -> int:
+        """Number of IPs with an in-memory request window."""
+        return sum(len(shard) for shard in self._request_shards)
+
+    def clear_request_windows(self) -> None:
+        """Drop all in-memory request windows."""
+        for shard, lock in zip(self._request_shards, self._shard_locks):
+            with lock:
+                shard.clear()
 
     def check_rate_limit(self, request: Request) -> None:
         """
@@ -120,21 +136,21 @@ class RateLimiter:
             HTTPException: 429 if rate limit exceeded
         """
         # Skip rate limiting in dev mode if configured
-        if settings.is_dev and settings.MAX_REQUESTS_PER_MINUTE > 1000:
+        if self._skip_requests:
             return
 
         ip = self._get_client_ip(request)
 
-        # Try Redis first
-        redis_count = self._get_redis_request_count(ip)
+        # Try Redis first (rejected requests still count toward the window)
+        redis_count = self._incr_redis_request_count(ip)
         if redis_count is not None:
             # Using Redis
-            if redis_count >= settings.MAX_REQUESTS_PER_MINUTE:
+            if redis_count > self._max_requests:
                 log_security_event(
                     "rate_limit_exceeded",
                     {
                         "ip": ip,
-                        "limit": settings.MAX_REQUESTS_PER_MINUTE,
+                        "limit": self._max_requests,
                         "type": "requests",
                         "source": "redis",
                     },
@@ -143,23 +159,30 @@ class RateLimiter:
                     status_code=429,
                     detail="Çok sık istek gönderdiniz. Lütfen 60 saniye sonra tekrar deneyin.",
                 )
-            self._increment_redis_request_count(ip)
             return
 
-        # Fallback to in-memory
-        now = time.time()
-        request_times = self._request_times[ip]
-        cutoff = now - 60
+        # Fallback to in-memory fixed window
+        now = time.monotonic_ns()
+        shard, lock = self._get_request_shard(ip)
+
+        with lock:
+            window = shard.get(ip)
+            if window is None:
+                window = shard[ip] = _RequestWindow(now)
+            elif now - window.window_start >= _REQUEST_WINDOW_NS:
+                window.count = 0
+                window.window_start = now
 
-        while request_times and request_times[0] < cutoff:
-            request_times.popleft()
+            limited = window.count >= self._max_requests
+            if not limited:
+                window.count += 1
 
-        if len(request_times) >= settings.MAX_REQUESTS_PER_MINUTE:
+        if limited:
             log_security_event(
                 "rate_limit_exceeded",
                 {
                     "ip": ip,
-                    "limit": settings.MAX_REQUESTS_PER_MINUTE,
+                    "limit": self._max_requests,
                     "type": "requests",
                     "source": "memory",
                 },
@@ -169,8 +192,6 @@ class RateLimiter:
                 detail="Çok sık istek gönderdiniz. Lütfen 60 saniye sonra tekrar deneyin.",
             )
 
-        request_times.append(now)
-
     def check_upload_limit(self, request: Request, file_size_bytes: int) -> None:
         """
         Check if upload size limit is exceeded for this IP.
@@ -184,38 +205,40 @@ class RateLimiter:
             HTTPException: 413 if upload limit exceeded
         """
         # Skip in dev mode
-        if settings.is_dev and settings.MAX_UPLOAD_MB_PER_HOUR > 10000:
+        if self._skip_uploads:
             return
 
         ip = self._get_client_ip(request)
-        max_bytes = settings.MAX_UPLOAD_MB_PER_HOUR * 1024 * 1024
+        max_bytes = self._max_upload_bytes
 
         # Try Redis first
-        redis_bytes = self._get_redis_upload_bytes(ip)
-        if redis_bytes is not None:
+        redis_total = self._incr_redis_upload_bytes(ip, file_size_bytes)
+        if redis_total is not None:
             # Using Redis
-            if redis_bytes + file_size_bytes > max_bytes:
+            if redis_total > max_bytes:
+                # Rejected uploads don't use up the allowance
+                self._release_redis_upload_bytes(ip, file_size_bytes)
+                redis_bytes = redis_total - file_size_bytes
                 log_security_event(
                     "upload_limit_exceeded",
                     {
                         "ip": ip,
                         "current_mb": redis_bytes / (1024 * 1024),
-                        "limit_mb": settings.MAX_UPLOAD_MB_PER_HOUR,
+                        "limit_mb": self._max_upload_mb,
                         "source": "redis",
                     },
                 )
                 raise HTTPException(
                     status_code=413,
-                    detail=f"Saatlik upload limitini aştınız. Limit: {settings.MAX_UPLOAD_MB_PER_HOUR} MB.",
+                    detail=f"Saatlik upload limitini aştınız. Limit: {self._max_upload_mb} MB.",
                 )
-            self._increment_redis_upload_bytes(ip, file_size_bytes)
             return
 
         # Fallback to in-memory
-        now = time.time()
+        now = time.monotonic_ns()
         upload_data = self._upload_bytes[ip]
 
-        if now - upload_data["window_start"] > 3600:
+        if now - upload_data["window_start"] > _UPLOAD_WINDOW_NS:
             upload_data["bytes"] = 0
             upload_data["window_start"] = now
 
@@ -225,13 +248,13 @@ class RateLimiter:
                 {
                     "ip": ip,
                     "current_mb": upload_data["bytes"] / (1024 * 1024),
-                    "limit_mb": settings.MAX_UPLOAD_MB_PER_HOUR,
+                    "limit_mb": self._max_upload_mb,
                     "source": "memory",
                 },
             )
             raise HTTPException(
                 status_code=413,
-                detail=f"Saatlik upload limitini aştınız. Limit: {settings.MAX_UPLOAD_MB_PER_HOUR} MB.",
+                detail=f"Saatlik upload limitini aştınız. Limit: {self._max_upload_mb} MB.",
             )
 
         upload_data["bytes"] += file_size_bytes
@@ -255,43 +278,36 @@ async def rate_limit_dependency(request: Request) -> None:
 
 def reset_rate_limits() -> None:
     """Reset all rate limits (useful for testing)."""
-    rate_limiter._request_times.clear()
+    rate_limiter.clear_request_windows()
     rate_limiter._upload_bytes.clear()
 
     # Also clear Redis rate limit keys
-    try:
-        from app.core.redis_client import get_redis_client
-
-        client = get_redis_client()
-        if client:
-            for pattern in ["ratelimit:requests:*", "ratelimit:upload:*"]:
-                keys = client.keys(f"{settings.REDIS_KEY_PREFIX}{pattern}")
-                if keys:
-                    client.delete(*keys)
-    except Exception as e:
-        logger.debug("redis_ratelimit_reset_failed", error=str(e))
+    for pattern in ("ratelimit:requests:*", "ratelimit:upload:*"):
+        redis_unlink_matching(pattern)
 
 
 def get_rate_limit_stats() -> dict:
     """Get rate limiter statistics."""
     stats = {
         "memory": {
-            "tracked_ips": len(rate_limiter._request_times),
+            "tracked_ips": rate_limiter.tracked_ip_count(),
             "upload_ips": len(rate_limiter._upload_bytes),
         },
         "redis": {"available": False, "request_keys": 0, "upload_keys": 0},
     }
 
     try:
-        from app.core.redis_client import get_redis_client
-
         client = get_redis_client()
         if client:
             stats["redis"]["available"] = True
             req_pattern = f"{settings.REDIS_KEY_PREFIX}ratelimit:requests:*"
             up_pattern = f"{settings.REDIS_KEY_PREFIX}ratelimit:upload:*"
-            stats["redis"]["request_keys"] = len(client.keys(req_pattern))
-            stats["redis"]["upload_keys"] = len(client.keys(up_pattern))
+            stats["redis"]["request_keys"] = sum(
+                1 for _ in client.scan_iter(match=req_pattern, count=_SCAN_COUNT)
+            )
+            stats["redis"]["upload_keys"] = sum(
+                1 for _ in client.scan_iter(match=up_pattern, count=_SCAN_COUNT)
+            )
     except Exception:
         pass
 
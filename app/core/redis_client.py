@@ -5,21 +5,67 @@ Provides Redis connection with automatic fallback to in-memory storage.
 Uses hiredis for performance optimization.
 """
 
+import functools
+import operator
 import time
-from typing import Any
+from typing import Any, Callable
 
+import redis
 import structlog
+from redis.utils import HIREDIS_AVAILABLE
 
 from app.core.config import settings
+from app.core.observability import DEBUG_LOGGING
 
 logger = structlog.get_logger("redis")
 
-# Redis client singleton
+# redis-py silently falls back to its pure-Python parser without hiredis;
+# it is a declared dependency, so say so once instead of running slow quietly
+if settings.REDIS_ENABLED and not HIREDIS_AVAILABLE:
+    logger.warning("hiredis_unavailable", parser="python")
+
+# Shared connection pool and client singleton
+_redis_pool: redis.ConnectionPool | None = None
 _redis_client: Any = None
 _redis_available: bool = False
 _last_connection_attempt: float = 0
 _CONNECTION_RETRY_INTERVAL: float = 30.0  # Retry every 30 seconds
 
+# Settings are frozen, so the key prefix and enabled flag are bound once
+_DISABLED = not settings.REDIS_ENABLED
+_PREFIX = settings.REDIS_KEY_PREFIX
+_PREFIX_LEN = len(_PREFIX)
+# C-level key[_PREFIX_LEN:] for map(); avoids a Python loop per key
+_strip_prefix = operator.itemgetter(slice(_PREFIX_LEN, None))
+
+
+# Set after a failed command until the next success; while set, further
+# failures log at debug so an outage doesn't log once per request
+_failing = False
+
+# SCAN page size hint, and keys per UNLINK call when flushing
+_SCAN_COUNT = 1000
+_DELETE_BATCH_SIZE = 500
+
+
+def _get_connection_pool() -> redis.ConnectionPool:
+    """Get or create the process-wide Redis connection pool."""
+    global _redis_pool
+
+    if _redis_pool is None:
+        _redis_pool = redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_POOL_SIZE,
+            decode_responses=True,
+            socket_connect_timeout=3,
+            socket_timeout=3,
+            socket_keepalive=True,
+            retry_on_timeout=True,
+            health_check_interval=30,
+        )
+
+    return _redis_pool
+
 
 def get_redis_client():
     """
@@ -29,13 +75,13 @@ def get_redis_client():
     """
     global _redis_client, _redis_available, _last_connection_attempt
 
+    # If we have a working client, return it (it only exists when enabled)
+    if _redis_available and _redis_client is not None:
+        return _redis_client
+
     if not settings.REDIS_ENABLED:
         return None
 
-    # If we have a working client, return it
-    if _redis_client is not None and _redis_available:
-        return _redis_client
-
     # If connection failed recently, don't retry immediately
     current_time = time.time()
     if (
@@ -47,16 +93,8 @@ def get_redis_client():
     _last_connection_attempt = current_time
 
     try:
-        import redis
-
-        _redis_client = redis.from_url(
-            settings.REDIS_URL,
-            decode_responses=True,
-            socket_connect_timeout=3,
-            socket_timeout=3,
-            retry_on_timeout=True,
-            health_check_interval=30,
-        )
+        # Clients are cheap wrappers; connections live in the shared pool
+        _redis_client = redis.Redis(connection_pool=_get_connection_pool())
         # Test connection
         _redis_client.ping()
         _redis_available = True
@@ -67,74 +105,148 @@ def get_redis_client():
         _redis_client = None
         logger.warning(
             "redis_connection_failed",
-            error=str(e),
+            error=e,
             fallback="in-memory",
             retry_in=f"{_CONNECTION_RETRY_INTERVAL}s",
         )
         return None
 
 
+def mark_redis_unavailable() -> None:
+    """
+    Drop the cached client after a connection failure.
+    The next get_redis_client() call waits out the retry interval.
+    """
+    global _redis_client, _redis_available, _last_connection_attempt
+
+    _redis_available = False
+    _redis_client = None
+    _last_connection_attempt = time.time()
+
+
 def is_redis_available() -> bool:
-    """Check if Redis is available and connected."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        client.ping()
-        return True
-    except Exception:
-        return False
+    """
+    Check if Redis is available and connected.
+    Returns the cached connection state without a PING round trip; pooled
+    connections are health-checked by the pool (health_check_interval).
+    """
+    return get_redis_client() is not None
+
 
+def _redis_op(event: str, default: Any = None) -> Callable:
+    """
+    Wrap a helper that takes the client as its first argument.
+    Returns `default` when Redis is disabled, unavailable or the command
+    fails (logged as `event`, at error level only for the first failure
+    in a row); a callable default such as list or dict is called for a
+    fresh value.
+    """
 
-def redis_get(key: str) -> str | None:
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            global _failing
+
+            if not _DISABLED:
+                # Fast path: reuse the cached client without a function call
+                client = _redis_client if _redis_available else get_redis_client()
+                if client is not None:
+                    try:
+                        result = func(client, *args, **kwargs)
+                    except Exception as e:
+                        # The renderer formats the exception only if emitted
+                        key = args[0] if args else None
+                        if not _failing:
+                            _failing = True
+                            logger.error(event, key=key, error=e)
+                        elif DEBUG_LOGGING:
+                            logger.debug(event, key=key, error=e)
+                    else:
+                        if _failing:
+                            _failing = False
+                        return result
+            return default() if callable(default) else default
+
+        return wrapper
+
+    return decorator
+
+
+@_redis_op("redis_get_error")
+def redis_get(client, key: str) -> str | None:
     """
     Get value from Redis with automatic key prefixing.
     Returns None if Redis is unavailable or key doesn't exist.
     """
-    client = get_redis_client()
-    if client is None:
-        return None
-    try:
-        return client.get(f"{settings.REDIS_KEY_PREFIX}{key}")
-    except Exception as e:
-        logger.error("redis_get_error", key=key, error=str(e))
-        return None
+    return client.get(_PREFIX + key)
 
 
-def redis_set(key: str, value: str, ttl: int | None = None) -> bool:
+@_redis_op("redis_set_error", default=False)
+def redis_set(client, key: str, value: str, ttl: int | None = None) -> bool:
     """
     Set value in Redis with automatic key prefixing.
     Returns False if Redis is unavailable.
     """
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        full_key = f"{settings.REDIS_KEY_PREFIX}{key}"
-        if ttl:
-            client.setex(full_key, ttl, value)
-        else:
-            client.set(full_key, value)
+    full_key = _PREFIX + key
+    if ttl:
+        client.setex(full_key, ttl, value)
+    else:
+        client.set(full_key, value)
+    return True
+
+
+def redis_mget(keys: list[str]) -> dict[str, str | None]:
+    """
+    Get several values in one MGET round trip.
+    Returns {key: value}; values are None for missing keys, or for every
+    key if Redis is unavailable.
+    """
+    if not keys:
+        return {}
+    values = _redis_mget(keys)
+    if values is None:
+        return dict.fromkeys(keys)
+    return dict(zip(keys, values))
+
+
+@_redis_op("redis_mget_error")
+def _redis_mget(client, keys: list[str]) -> list[str | None]:
+    return client.mget([_PREFIX + k for k in keys])
+
+
+def redis_mset(mapping: dict[str, str], ttl: int | None = None) -> bool:
+    """
+    Set several values in one round trip.
+    MSET has no per-key expiry, so with a TTL the SETEX calls are
+    pipelined instead. Returns False if Redis is unavailable.
+    """
+    if not mapping:
         return True
-    except Exception as e:
-        logger.error("redis_set_error", key=key, error=str(e))
-        return False
+    return _redis_mset(mapping, ttl)
 
 
-def redis_delete(key: str) -> bool:
-    """Delete a key from Redis."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        client.delete(f"{settings.REDIS_KEY_PREFIX}{key}")
+@_redis_op("redis_mset_error", default=False)
+def _redis_mset(client, mapping: dict[str, str], ttl: int | None) -> bool:
+    if not ttl:
+        client.mset({_PREFIX + k: v for k, v in mapping.items()})
         return True
-    except Exception as e:
-        logger.error("redis_delete_error", key=key, error=str(e))
-        return False
 
+    pipe = client.pipeline(transaction=False)
+    for k, v in mapping.items():
+        pipe.setex(_PREFIX + k, ttl, v)
+    pipe.execute()
+    return True
+
+
+@_redis_op("redis_delete_error", default=False)
+def redis_delete(client, key: str) -> bool:
+    """Delete a key from Redis."""
+    client.delete(_PREFIX + key)
+    return True
 
-def redis_incr(key: str, amount: int = 1, ttl: int | None = None) -> int | None:
+
+@_redis_op("redis_incr_error")
+def redis_incr(client, key: str, amount: int = 1, ttl: int | None = None) -> int | None:
     """
     Increment a counter in Redis.
     Creates key with value `amount` if it doesn't exist.
@@ -142,138 +254,113 @@ def redis_incr(key: str, amount: int = 1, ttl: int | None = None) -> int | None:
     Args:
         key: The key to increment
         amount: Amount to increment by (default: 1)
-        ttl: Optional TTL in seconds (only set on first increment)
+        ttl: Optional TTL in seconds (only set if the key has none)
+
+    Returns:
+        The value after the increment, or None if Redis is unavailable
     """
-    client = get_redis_client()
-    if client is None:
-        return None
-    try:
-        full_key = f"{settings.REDIS_KEY_PREFIX}{key}"
-        value = client.incrby(full_key, amount)
-        if ttl and value == amount:  # Only set TTL on first increment
-            client.expire(full_key, ttl)
-        return value
-    except Exception as e:
-        logger.error("redis_incr_error", key=key, error=str(e))
-        return None
+    full_key = _PREFIX + key
+    if not ttl:
+        return client.incrby(full_key, amount)
+
+    # INCRBY + EXPIRE NX in one round trip (EXPIRE NX needs Redis 7)
+    pipe = client.pipeline(transaction=False)
+    pipe.incrby(full_key, amount)
+    pipe.expire(full_key, ttl, nx=True)
+    value, _ = pipe.execute()
+    return value
 
 
-def redis_lpush(key: str, value: str, max_length: int | None = None) -> bool:
+@_redis_op("redis_lpush_error", default=False)
+def redis_lpush(client, key: str, value: str, max_length: int | None = None) -> bool:
     """Push value to a Redis list (left side)."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        full_key = f"{settings.REDIS_KEY_PREFIX}{key}"
+    full_key = _PREFIX + key
+    if not max_length:
         client.lpush(full_key, value)
-        if max_length:
-            client.ltrim(full_key, 0, max_length - 1)
         return True
-    except Exception as e:
-        logger.error("redis_lpush_error", key=key, error=str(e))
-        return False
+
+    # LPUSH + LTRIM in one round trip
+    pipe = client.pipeline(transaction=False)
+    pipe.lpush(full_key, value)
+    pipe.ltrim(full_key, 0, max_length - 1)
+    pipe.execute()
+    return True
 
 
-def redis_lrange(key: str, start: int = 0, end: int = -1) -> list[str]:
+@_redis_op("redis_lrange_error", default=list)
+def redis_lrange(client, key: str, start: int = 0, end: int = -1) -> list[str]:
     """Get range of values from a Redis list."""
-    client = get_redis_client()
-    if client is None:
-        return []
-    try:
-        return client.lrange(f"{settings.REDIS_KEY_PREFIX}{key}", start, end)
-    except Exception as e:
-        logger.error("redis_lrange_error", key=key, error=str(e))
-        return []
+    return client.lrange(_PREFIX + key, start, end)
 
 
-def redis_hset(key: str, field: str, value: str) -> bool:
+@_redis_op("redis_hset_error", default=False)
+def redis_hset(client, key: str, field: str, value: str) -> bool:
     """Set a hash field in Redis."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        client.hset(f"{settings.REDIS_KEY_PREFIX}{key}", field, value)
-        return True
-    except Exception as e:
-        logger.error("redis_hset_error", key=key, error=str(e))
-        return False
+    client.hset(_PREFIX + key, field, value)
+    return True
 
 
-def redis_hget(key: str, field: str) -> str | None:
+@_redis_op("redis_hget_error")
+def redis_hget(client, key: str, field: str) -> str | None:
     """Get a hash field from Redis."""
-    client = get_redis_client()
-    if client is None:
-        return None
-    try:
-        return client.hget(f"{settings.REDIS_KEY_PREFIX}{key}", field)
-    except Exception as e:
-        logger.error("redis_hget_error", key=key, error=str(e))
-        return None
+    return client.hget(_PREFIX + key, field)
 
 
-def redis_hgetall(key: str) -> dict[str, str]:
+@_redis_op("redis_hgetall_error", default=dict)
+def redis_hgetall(client, key: str) -> dict[str, str]:
     """Get all hash fields from Redis."""
-    client = get_redis_client()
-    if client is None:
-        return {}
-    try:
-        return client.hgetall(f"{settings.REDIS_KEY_PREFIX}{key}")
-    except Exception as e:
-        logger.error("redis_hgetall_error", key=key, error=str(e))
-        return {}
+    return client.hgetall(_PREFIX + key)
 
 
-def redis_hincrby(key: str, field: str, amount: int = 1) -> int | None:
+@_redis_op("redis_hincrby_error")
+def redis_hincrby(client, key: str, field: str, amount: int = 1) -> int | None:
     """Increment a hash field by amount."""
-    client = get_redis_client()
-    if client is None:
-        return None
-    try:
-        return client.hincrby(f"{settings.REDIS_KEY_PREFIX}{key}", field, amount)
-    except Exception as e:
-        logger.error("redis_hincrby_error", key=key, error=str(e))
-        return None
+    return client.hincrby(_PREFIX + key, field, amount)
 
 
-def redis_expire(key: str, ttl: int) -> bool:
+@_redis_op("redis_expire_error", default=False)
+def redis_expire(client, key: str, ttl: int) -> bool:
     """Set TTL on a key."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        client.expire(f"{settings.REDIS_KEY_PREFIX}{key}", ttl)
-        return True
-    except Exception as e:
-        logger.error("redis_expire_error", key=key, error=str(e))
-        return False
+    client.expire(_PREFIX + key, ttl)
+    return True
 
 
-def redis_keys(pattern: str) -> list[str]:
-    """Get keys matching pattern (use with caution in production)."""
-    client = get_redis_client()
-    if client is None:
-        return []
-    try:
-        full_pattern = f"{settings.REDIS_KEY_PREFIX}{pattern}"
-        keys = client.keys(full_pattern)
-        # Remove prefix from returned keys
-        prefix_len = len(settings.REDIS_KEY_PREFIX)
-        return [k[prefix_len:] for k in keys]
-    except Exception as e:
-        logger.error("redis_keys_error", pattern=pattern, error=str(e))
-        return []
+@_redis_op("redis_keys_error", default=list)
+def redis_keys(client, pattern: str) -> list[str]:
+    """
+    Get keys matching pattern.
+    Iterates with SCAN, so the server is never blocked like with KEYS.
+    """
+    # Remove prefix from returned keys
+    return list(
+        map(
+            _strip_prefix,
+            client.scan_iter(match=_PREFIX + pattern, count=_SCAN_COUNT),
+        )
+    )
+
 
+def _unlink_scan(client, match: str) -> None:
+    """SCAN in pages and UNLINK in batches; memory is freed server-side."""
+    batch: list[str] = []
+    for key in client.scan_iter(match=match, count=_SCAN_COUNT):
+        batch.append(key)
+        if len(batch) >= _DELETE_BATCH_SIZE:
+            client.unlink(*batch)
+            batch.clear()
+    if batch:
+        client.unlink(*batch)
 
-def redis_flush_prefix() -> bool:
+
+@_redis_op("redis_unlink_error", default=False)
+def redis_unlink_matching(client, pattern: str) -> bool:
+    """Delete all keys matching pattern (prefix added automatically)."""
+    _unlink_scan(client, _PREFIX + pattern)
+    return True
+
+
+@_redis_op("redis_flush_error", default=False)
+def redis_flush_prefix(client) -> bool:
     """Flush all keys with our prefix (careful in production!)."""
-    client = get_redis_client()
-    if client is None:
-        return False
-    try:
-        keys = client.keys(f"{settings.REDIS_KEY_PREFIX}*")
-        if keys:
-            client.delete(*keys)
-        return True
-    except Exception as e:
-        logger.error("redis_flush_error", error=str(e))
-        return False
+    _unlink_scan(client, _PREFIX + "*")
+    return True
@@ -3,16 +3,27 @@ Common upload pipeline with security validation.
 Provides centralized file validation for all tools.
 """
 
-from io import BytesIO
+import asyncio
+import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 import puremagic
+import structlog
 from fastapi import HTTPException, UploadFile
 from PIL import Image
 from pypdf import PdfReader
 
 from app.core.config import settings
 
+logger = structlog.get_logger("upload")
+
+# Magic-byte detection only needs the leading bytes of a file
+_MAGIC_HEADER_BYTES = 4096
+
+# Uploads are copied to disk in chunks of this size
+_COPY_CHUNK_BYTES = 1024 * 1024
+
 
 # Custom Exceptions
 class InvalidFileError(Exception):
@@ -45,29 +56,44 @@ class InvalidPDFError(InvalidFileError):
     pass
 
 
+def _check_upload_size(file: UploadFile, max_size_mb: int) -> int:
+    """
+    Returns the upload size in bytes without reading the upload.
+    Raises FileTooLargeError if it exceeds max_size_mb.
+    """
+    size = file.size
+    if size is None:
+        file.file.seek(0, 2)
+        size = file.file.tell()
+
+    if size > max_size_mb * 1024 * 1024:
+        raise FileTooLargeError(
+            f"Dosya boyutu çok büyük. Maksimum {max_size_mb}MB yükleyebilirsiniz."
+        )
+    return size
+
+
 async def validate_file(
     file: UploadFile, max_size_mb: int, allowed_mimes: set[str]
-) -> bytes:
+) -> tuple[BinaryIO, int]:
     """
     Validates file size and MIME type.
-    Returns the file content as bytes.
+    Returns (file object rewound to the start, size in bytes).
+    Only the header is read, so the upload is never copied into memory.
     """
     # 1. Size Check
-    file.file.seek(0, 2)
-    size = file.file.tell()
-    file.file.seek(0)
-
-    if size > max_size_mb * 1024 * 1024:
-        raise HTTPException(
-            status_code=413,
-            detail=f"Dosya boyutu çok büyük. Maksimum {max_size_mb}MB yükleyebilirsiniz.",
-        )
+    try:
+        size = _check_upload_size(file, max_size_mb)
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
 
-    content = await file.read()
+    await file.seek(0)
+    head = await file.read(_MAGIC_HEADER_BYTES)
+    await file.seek(0)
 
     # 2. Magic Bytes Check
     try:
-        mime = puremagic.from_string(content, mime=True)
+        mime = puremagic.from_string(head, mime=True)
         if mime not in allowed_mimes:
             raise HTTPException(
                 status_code=400,
@@ -76,7 +102,43 @@ async def validate_file(
     except puremagic.PureError:
         raise HTTPException(status_code=400, detail="Dosya türü belirlenemedi.")
 
-    return content
+    return file.file, size
+
+
+def _copy_upload(stream: BinaryIO, dest: Path) -> None:
+    stream.seek(0)
+    with open(dest, "wb") as f:
+        shutil.copyfileobj(stream, f, _COPY_CHUNK_BYTES)
+
+
+async def save_upload(file: UploadFile, dest: Path, max_size_mb: int) -> None:
+    """
+    Copies an upload to dest in chunks, off the event loop.
+    Raises FileTooLargeError before anything is read if it exceeds max_size_mb.
+    """
+    _check_upload_size(file, max_size_mb)
+    await asyncio.to_thread(_copy_upload, file.file, dest)
+
+
+def open_upload(file: UploadFile, max_size_mb: int) -> BinaryIO:
+    """
+    Returns the spooled upload rewound to the start, for readers that take
+    a file object, so nothing is copied.
+    Raises FileTooLargeError if it exceeds max_size_mb.
+    """
+    _check_upload_size(file, max_size_mb)
+    file.file.seek(0)
+    return file.file
+
+
+async def read_upload(file: UploadFile, max_size_mb: int) -> bytes:
+    """
+    Reads an upload into memory.
+    Raises FileTooLargeError before anything is read if it exceeds max_size_mb.
+    """
+    _check_upload_size(file, max_size_mb)
+    await file.seek(0)
+    return await file.read()
 
 
 async def validate_and_load_image(file: UploadFile) -> tuple[Image.Image, str, int]:
@@ -84,32 +146,32 @@ async def validate_and_load_image(file: UploadFile) -> tuple[Image.Image, str, i
     Validates and loads an image using Pillow.
     Returns (Image object, filename, original_size).
     """
-    content = await validate_file(
+    stream, size = await validate_file(
         file, settings.MAX_IMAGE_SIZE_MB, settings.ALLOWED_IMAGE_MIME_TYPES
     )
 
     try:
-        img = Image.open(BytesIO(content))
-        img.verify()  # Verify integrity
-        img = Image.open(BytesIO(content))  # Re-open after verify
+        # Open parses and checks the header only; pixel data decodes lazily
+        # on first use, so a separate verify() pass would parse it twice
+        img = Image.open(stream)
 
-        return img, file.filename, len(content)
+        return img, file.filename, size
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Geçersiz resim dosyası: {str(e)}")
 
 
-async def validate_pdf(file: UploadFile) -> bytes:
+async def validate_pdf(file: UploadFile) -> BinaryIO:
     """
     Validates a PDF file.
-    Returns file content as bytes.
+    Returns the file object rewound to the start.
     """
-    content = await validate_file(
+    stream, _ = await validate_file(
         file, settings.MAX_PDF_SIZE_MB, settings.ALLOWED_PDF_MIME_TYPES
     )
 
     # Additional PDF validation
     try:
-        reader = PdfReader(BytesIO(content))
+        reader = PdfReader(stream)
         if len(reader.pages) == 0:
             raise HTTPException(status_code=400, detail="PDF dosyası boş.")
     except Exception as e:
@@ -120,7 +182,8 @@ async def validate_pdf(file: UploadFile) -> bytes:
             detail="Geçersiz PDF dosyası. Lütfen geçerli bir PDF yükleyin.",
         )
 
-    return content
+    stream.seek(0)
+    return stream
 
 
 def cleanup_temp_files(*paths: Path) -> None:
@@ -130,17 +193,15 @@ def cleanup_temp_files(*paths: Path) -> None:
     Args:
         *paths: Paths to files/directories to clean up
     """
-    import shutil
-
     for path in paths:
-        if not path or not path.exists():
+        if not path:
             continue
 
         try:
-            if path.is_file():
-                path.unlink()
-            elif path.is_dir():
-                shutil.rmtree(path)
+            # Unlink first: files are the common case and need no extra stat
+            path.unlink(missing_ok=True)
+        except IsADirectoryError:
+            shutil.rmtree(path, ignore_errors=True)
         except Exception as e:
             # Log but don't raise - cleanup failures shouldn't break the app
-            print(f"⚠️ Cleanup failed for {path}: {e}")
+            logger.warning("temp_cleanup_failed", path=str(path), error=str(e))
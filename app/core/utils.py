@@ -1,34 +1,43 @@
 import json
 import os
 import random
+from functools import cache
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from app.core.config import settings
 
+_TECH_TRIVIA: tuple[str, ...] = (
+    "İlk webcam, Cambridge Üniversitesi'ndeki bir kahve makinesini izlemek için icat edildi.",
+    "İlk bilgisayar faresi ahşaptan yapılmıştı.",
+    "Python ismi yılandan değil, Monty Python grubundan gelir.",
+    "Dünyadaki ilk web sitesi hala yayındadır (info.cern.ch).",
+    "QWERTY klavye düzeni, daktilo tuşlarının sıkışmasını önlemek için tasarlandı.",
+    "Her gün yaklaşık 300 milyar e-posta gönderiliyor.",
+    "Google'ın orijinal adı 'Backrub' idi.",
+    "İlk 1GB hard disk 1980'de çıktı, 250 kg ağırlığındaydı ve 40.000 dolardı.",
+    "İnternetin babası Vint Cerf, aynı zamanda işitme engellidir.",
+    "NASA'nın internet hızı 91 GB/s'dir.",
+)
+
 
 def get_random_tech_trivia() -> str:
     """Returns a random interesting tech fact in Turkish."""
-    facts = [
-        "İlk webcam, Cambridge Üniversitesi'ndeki bir kahve makinesini izlemek için icat edildi.",
-        "İlk bilgisayar faresi ahşaptan yapılmıştı.",
-        "Python ismi yılandan değil, Monty Python grubundan gelir.",
-        "Dünyadaki ilk web sitesi hala yayındadır (info.cern.ch).",
-        "QWERTY klavye düzeni, daktilo tuşlarının sıkışmasını önlemek için tasarlandı.",
-        "Her gün yaklaşık 300 milyar e-posta gönderiliyor.",
-        "Google'ın orijinal adı 'Backrub' idi.",
-        "İlk 1GB hard disk 1980'de çıktı, 250 kg ağırlığındaydı ve 40.000 dolardı.",
-        "İnternetin babası Vint Cerf, aynı zamanda işitme engellidir.",
-        "NASA'nın internet hızı 91 GB/s'dir.",
-    ]
-    return random.choice(facts)
+    return random.choice(_TECH_TRIVIA)
+
+
+# Compiled templates shared across tools, workers and restarts (per-user temp dir)
+_BYTECODE_CACHE = FileSystemBytecodeCache()
 
 
+@cache
 def get_tool_templates(tool_file_path: str) -> Jinja2Templates:
     """
     Creates a Jinja2Templates instance for a specific tool.
     Includes the tool's templates directory and the global templates directory.
     Automatically adds settings to Jinja2 globals for SEO.
+    Memoized per path, so each tool builds its Jinja environment once.
     """
     tool_dir = os.path.dirname(os.path.abspath(tool_file_path))
     templates = Jinja2Templates(
@@ -39,6 +48,9 @@ def get_tool_templates(tool_file_path: str) -> Jinja2Templates:
     )
     # Add settings to Jinja2 globals for SEO (v0.7.0)
     templates.env.globals["settings"] = settings
+    templates.env.bytecode_cache = _BYTECODE_CACHE
+    # Templates only change on deploy in prod; skip the per-render mtime stat
+    templates.env.auto_reload = not settings.is_prod
 
     # Add custom filters
     templates.env.filters["tojson"] = json.dumps
@@ -1,10 +1,17 @@
+import asyncio
 import importlib
 import os
 import pkgutil
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from dataclasses import asdict
+from datetime import date
+from functools import lru_cache
+from types import MappingProxyType
 
+import orjson
+import structlog
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import HTMLResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
@@ -13,8 +20,12 @@ from fastapi.templating import Jinja2Templates
 import app.tools as tools_pkg
 from app.core.config import settings
 from app.core.health import get_health_status, is_ready
+from app.core.observability import init_stats
+from app.tools._tool_manifest import TOOL_MODULES
 from app.tools.registry import Category, ToolRegistry
 
+logger = structlog.get_logger("main")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -22,10 +33,27 @@ async def lifespan(app: FastAPI):
     Application Lifecycle Events
     """
     # Startup: Clean temp directory
-    # Sunucu her başladığında temp klasörünü temizle ki disk dolmasın
-    if settings.TEMP_DIR.exists():
-        shutil.rmtree(settings.TEMP_DIR)
-    settings.TEMP_DIR.mkdir(parents=True, exist_ok=True)
+    # Sunucu her başladığında temp klasörünü temizle ki disk dolmasın.
+    # Eski klasör kenara taşınıp arka planda silinir; başlangıç beklemez.
+    temp_dir = settings.TEMP_DIR
+    stale_dirs = list(temp_dir.parent.glob(f"{temp_dir.name}.old-*"))
+    if temp_dir.exists():
+        old_dir = temp_dir.with_name(f"{temp_dir.name}.old-{os.getpid()}")
+        if old_dir.exists():
+            shutil.rmtree(old_dir, ignore_errors=True)
+        try:
+            temp_dir.rename(old_dir)
+            stale_dirs.append(old_dir)
+        except FileNotFoundError:
+            # Başka bir worker klasörü bizden önce taşıdı
+            pass
+    temp_dir.mkdir(parents=True, exist_ok=True)
+
+    loop = asyncio.get_running_loop()
+    if settings.DEBUG and not type(loop).__module__.startswith("uvloop"):
+        logger.warning("uvloop_unavailable", loop=type(loop).__module__)
+    for stale_dir in stale_dirs:
+        loop.run_in_executor(None, shutil.rmtree, stale_dir, True)
 
     # Warm up Redis connection at startup
     try:
@@ -41,7 +69,10 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown events (if any)
+    # Shutdown: release pooled outbound HTTP connections
+    from app.core.image_utils import close_http_client
+
+    await close_http_client()
 
 
 # Initialize App with environment-aware configuration
@@ -63,29 +94,104 @@ templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
 
 # Add settings to Jinja2 globals for SEO (v0.7.0)
 templates.env.globals["settings"] = settings
+templates.env.auto_reload = not settings.is_prod
+
+
+# Category-based sitemap priorities (read-only, shared by every render)
+_SITEMAP_PRIORITIES = MappingProxyType(
+    {
+        Category.IMAGE: 0.9,  # High priority - popular tools
+        Category.OFFICE: 0.9,  # High priority - business use
+        Category.DEV: 0.8,  # Medium-high - developer tools
+        Category.SECURITY: 0.85,  # High - security critical
+        Category.OTHER: 0.7,  # Medium - utility tools
+    }
+)
+
+
+@lru_cache(maxsize=8)
+def _render_sitemap(base_url: str, today: str) -> bytes:
+    """Render the sitemap once per base URL and day; the tool list is static."""
+    parts = [
+        f"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url>
+        <loc>{base_url}/</loc>
+        <lastmod>{today}</lastmod>
+        <changefreq>daily</changefreq>
+        <priority>1.0</priority>
+    </url>"""
+    ]
+    parts.extend(
+        f"""
+    <url>
+        <loc>{base_url}/tools/{tool.slug}/</loc>
+        <lastmod>{today}</lastmod>
+        <changefreq>weekly</changefreq>
+        <priority>{_SITEMAP_PRIORITIES.get(tool.category, 0.7)}</priority>
+    </url>"""
+        for tool in ToolRegistry.get_tools()
+    )
+    parts.append("\n</urlset>")
+    return "".join(parts).encode("utf-8")
 
 
 # --- TOOL REGISTRATION (AUTO-DISCOVERY) ---
+_TOOL_IMPORT_WORKERS = 8
+
+
 def autodiscover_tools():
     """
     app/tools/ altındaki tüm klasörleri tarar ve 'router.py' modüllerini import eder.
     Bu sayede araçlar kendilerini ToolRegistry'ye otomatik olarak kaydeder.
+    Importlar paralel yapılır (disk I/O ve .pyc okuma örtüşür), ardından
+    kayıt sırası klasör sırasına göre sabitlenir.
+    Klasör yalnızca DEBUG modunda taranır; aksi halde TOOL_MODULES kullanılır.
     """
     package = tools_pkg
     prefix = package.__name__ + "."
-
-    for _, name, is_pkg in pkgutil.iter_modules(package.__path__, prefix):
-        if is_pkg:
+    if settings.DEBUG:
+        names = [
+            name
+            for _, name, is_pkg in pkgutil.iter_modules(package.__path__, prefix)
+            if is_pkg
+        ]
+    else:
+        names = [prefix + name for name in TOOL_MODULES]
+
+    # Her aracın router.py dosyasını import etmeye çalış
+    # Örn: app.tools.resim_cevirici.router
+    with ThreadPoolExecutor(max_workers=_TOOL_IMPORT_WORKERS) as pool:
+        futures = [
+            pool.submit(importlib.import_module, f"{name}.router") for name in names
+        ]
+
+    slugs = []
+    for name, future in zip(names, futures):
+        try:
             try:
-                # Her aracın router.py dosyasını import etmeye çalış
-                # Örn: app.tools.resim_cevirici.router
-                importlib.import_module(f"{name}.router")
-            except ImportError as e:
-                # Eğer router.py yoksa veya hata varsa logla ama uygulamayı durdurma
-                print(f"⚠️ Araç yüklenirken hata: {name} -> {e}")
+                module = future.result()
+            except RuntimeError:
+                # Paralel import kilit çakışması (_DeadlockError); sıralı tekrar dene
+                module = importlib.import_module(f"{name}.router")
+        except ImportError as e:
+            # Eğer router.py yoksa veya hata varsa logla ama uygulamayı durdurma
+            print(f"⚠️ Araç yüklenirken hata: {name} -> {e}")
+            continue
+
+        tool_info = getattr(module, "tool_info", None)
+        if tool_info is not None:
+            slugs.append(tool_info.slug)
+
+    # Registration order must not depend on thread scheduling
+    ToolRegistry.reorder(slugs)
+
+    # Registry changed; drop any sitemap rendered from the old tool list
+    _render_sitemap.cache_clear()
 
 
 autodiscover_tools()
+init_stats([tool.slug for tool in ToolRegistry.get_tools()])
 # ------------------------------------------
 
 # Mount Tool Routers
@@ -94,6 +200,13 @@ for router in ToolRegistry.get_routers():
 
 
 # --- HEALTH CHECK ENDPOINTS (v0.9.0) ---
+# Probes fire every few seconds and health rarely flips within one
+_HEALTH_RESPONSE_TTL_SECONDS = 1.0
+
+# Last serialized /health response: (monotonic timestamp, status code, body)
+_health_response_cache: tuple[float, int, bytes] | None = None
+
+
 @app.get("/health", response_class=JSONResponse, tags=["Health"])
 async def health_check():
     """
@@ -101,9 +214,19 @@ async def health_check():
     Returns comprehensive health status including all system checks.
     Used by container orchestration (Kubernetes, Docker) for liveness probes.
     """
-    health = get_health_status()
-    status_code = 200 if health.status == "healthy" else 503
-    return JSONResponse(content=asdict(health), status_code=status_code)
+    global _health_response_cache
+
+    now = time.monotonic()
+    cached = _health_response_cache
+    if cached is None or now - cached[0] >= _HEALTH_RESPONSE_TTL_SECONDS:
+        health = get_health_status()
+        status_code = 200 if health.status == "healthy" else 503
+        # orjson serializes the dataclass directly, no asdict() deep copy
+        cached = _health_response_cache = (now, status_code, orjson.dumps(health))
+
+    return Response(
+        content=cached[2], status_code=cached[1], media_type="application/json"
+    )
 
 
 @app.get("/ready", response_class=JSONResponse, tags=["Health"])
@@ -115,9 +238,12 @@ async def readiness_check():
     """
     ready, reason = is_ready()
     status_code = 200 if ready else 503
-    return JSONResponse(
-        content={"ready": ready, "reason": reason, "version": settings.VERSION},
+    return Response(
+        content=orjson.dumps(
+            {"ready": ready, "reason": reason, "version": settings.VERSION}
+        ),
         status_code=status_code,
+        media_type="application/json",
     )
 
 
@@ -157,43 +283,9 @@ async def admin_stats(request: Request):
 @app.get("/sitemap.xml", response_class=Response)
 async def sitemap(request: Request):
     """Generate sitemap with category-based priorities (v0.7.0)"""
-    from datetime import datetime
-
     base_url = str(request.base_url).rstrip("/")
-    tools = ToolRegistry.get_tools()
-    today = datetime.now().strftime("%Y-%m-%d")
-
-    xml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    <url>
-        <loc>{base_url}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>1.0</priority>
-    </url>"""
-
-    # Category-based priorities
-    category_priorities = {
-        Category.IMAGE: 0.9,  # High priority - popular tools
-        Category.OFFICE: 0.9,  # High priority - business use
-        Category.DEV: 0.8,  # Medium-high - developer tools
-        Category.SECURITY: 0.85,  # High - security critical
-        Category.OTHER: 0.7,  # Medium - utility tools
-    }
-
-    for tool in tools:
-        priority = category_priorities.get(tool.category, 0.7)
-        xml_content += f"""
-    <url>
-        <loc>{base_url}/tools/{tool.slug}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>{priority}</priority>
-    </url>"""
-
-    xml_content += "\n</urlset>"
-
-    return Response(content=xml_content, media_type="application/xml")
+    content = _render_sitemap(base_url, date.today().isoformat())
+    return Response(content=content, media_type="application/xml")
 
 
 @app.get("/metrics", response_class=Response, tags=["Monitoring"])
@@ -205,3 +297,18 @@ async def prometheus_metrics():
     from app.core.metrics import get_metrics, get_metrics_content_type
 
     return Response(content=get_metrics(), media_type=get_metrics_content_type())
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        # "auto" picks uvloop where it is installed (not on Windows)
+        loop="auto",
+        http="httptools",
+        # Same worker count as the Dockerfile and `make prod`
+        workers=4,
+    )
@@ -0,0 +1,26 @@
+"""
+Static list of tool packages under app/tools/.
+Production startup imports these directly instead of scanning the directory;
+keep it in sync when adding a tool (tests/test_main.py checks this).
+"""
+
+TOOL_MODULES: tuple[str, ...] = (
+    "base64_tool",
+    "base_converter",
+    "color_picker",
+    "dice_roller",
+    "hash_generator",
+    "image_converter",
+    "image_cropper",
+    "image_metadata",
+    "image_resizer",
+    "json_formatter",
+    "lorem_ipsum",
+    "markdown_preview",
+    "password_generator",
+    "pdf_merger",
+    "pdf_splitter",
+    "qr_code",
+    "qr_code_reader",
+    "url_tool",
+)
@@ -73,6 +73,11 @@ async def base_converter_page(request: Request):
     )
 
 
+def _is_canonical_decimal(value: str) -> bool:
+    """True if str(int(value)) would return value unchanged."""
+    return value.isascii() and value.isdigit() and (value[0] != "0" or value == "0")
+
+
 @router.post("/convert", response_class=HTMLResponse)
 async def convert_base(
     request: Request,
@@ -103,14 +108,18 @@ async def convert_base(
                 },
             )
 
-        # Convert to all bases
+        # Convert to all bases; format() renders without a prefix to strip
+        # and keeps the sign of negative numbers
+        if from_base == 10 and _is_canonical_decimal(value):
+            # Decimal-to-string is the costly direction for big numbers
+            decimal = value
+        else:
+            decimal = str(decimal_value)
         results = {
-            "binary": bin(decimal_value)[2:],  # Remove '0b' prefix
-            "octal": oct(decimal_value)[2:],  # Remove '0o' prefix
-            "decimal": str(decimal_value),
-            "hexadecimal": hex(decimal_value)[
-                2:
-            ].upper(),  # Remove '0x' prefix and uppercase
+            "binary": format(decimal_value, "b"),
+            "octal": format(decimal_value, "o"),
+            "decimal": decimal,
+            "hexadecimal": format(decimal_value, "X"),
         }
 
         log_tool_call(
@@ -120,14 +129,14 @@ async def convert_base(
             {"from_base": from_base, "value": value},
         )
 
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/result.html",
-            context={
-                "results": results,
-                "input_value": value,
-                "from_base": from_base,
-            },
+        # The partial never reads `request`; render it directly and skip
+        # building a TemplateResponse
+        return HTMLResponse(
+            templates.get_template("partials/result.html").render(
+                results=results,
+                input_value=value,
+                from_base=from_base,
+            )
         )
 
     except Exception as e:
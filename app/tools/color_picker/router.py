@@ -8,6 +8,7 @@ Desteklenen formatlar: HEX, RGB, HSL, CMYK
 import colorsys
 import re
 import time
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
@@ -70,13 +71,23 @@ def hex_to_rgb(hex_color: str) -> tuple[int, ...]:
     """Convert HEX to RGB."""
     hex_color = hex_color.lstrip("#")
     if len(hex_color) == 3:
-        hex_color = "".join([c * 2 for c in hex_color])
-    return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        # Shorthand: each nibble N expands to NN, i.e. N * 0x11
+        v = int(hex_color, 16)
+        return (v >> 8) * 0x11, (v >> 4 & 0xF) * 0x11, (v & 0xF) * 0x11
+    # One C-level parse instead of three slice + int(..., 16) calls
+    return tuple(bytes.fromhex(hex_color))
 
 
 def rgb_to_hex(r: int, g: int, b: int) -> str:
     """Convert RGB to HEX."""
-    return "#{:02x}{:02x}{:02x}".format(r, g, b)
+    # bytes.hex() skips the format mini-language; components must be 0-255
+    return "#" + bytes((r, g, b)).hex()
+
+
+def _palette_hex(h_deg: int, l_pct: int, s_pct: int) -> str:
+    """Convert HSL (degrees, percent, percent) straight to HEX."""
+    r, g, b = colorsys.hls_to_rgb((h_deg % 360) / 360, l_pct / 100, s_pct / 100)
+    return rgb_to_hex(int(r * 255), int(g * 255), int(b * 255))
 
 
 def rgb_to_hsl(r: int, g: int, b: int) -> tuple[int, int, int]:
@@ -87,38 +98,54 @@ def rgb_to_hsl(r: int, g: int, b: int) -> tuple[int, int, int]:
 
 def rgb_to_cmyk(r: int, g: int, b: int) -> tuple[int, int, int, int]:
     """Convert RGB to CMYK."""
-    if (r, g, b) == (0, 0, 0):
+    # Integer form of C = (1 - r/255 - K) / (1 - K) with K = 1 - max/255;
+    # exact floors, so no float truncation artifacts (0.2 -> 19%)
+    mx = max(r, g, b)
+    if mx == 0:
         return 0, 0, 0, 100
 
-    c = 1 - r / 255
-    m = 1 - g / 255
-    y = 1 - b / 255
+    return (
+        (mx - r) * 100 // mx,
+        (mx - g) * 100 // mx,
+        (mx - b) * 100 // mx,
+        (255 - mx) * 100 // 255,
+    )
 
-    min_cmy = min(c, m, y)
-    c = (c - min_cmy) / (1 - min_cmy)
-    m = (m - min_cmy) / (1 - min_cmy)
-    y = (y - min_cmy) / (1 - min_cmy)
-    k = min_cmy
 
-    return int(c * 100), int(m * 100), int(y * 100), int(k * 100)
+_HEX_RE = re.compile(r"^#?([0-9a-f]{3}|[0-9a-f]{6})$")
+_RGB_RE = re.compile(r"^rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$")
+_RAW_HEX_RE = re.compile(r"^[0-9a-f]{6}$")
 
 
-def parse_color(color: str) -> tuple[int, ...] | None:
-    """Parse color string to RGB tuple."""
-    color = color.strip().lower()
+# Longer strings are never valid colors; also bounds the parse cache's memory
+_MAX_COLOR_LEN = 64
+
 
+@lru_cache(maxsize=1024)
+def _parse_normalized_color(color: str) -> tuple[int, ...] | None:
     # HEX
-    if re.match(r"^#?([0-9a-f]{3}|[0-9a-f]{6})$", color):
+    if _HEX_RE.match(color):
         return hex_to_rgb(color)
 
     # RGB
-    rgb_match = re.match(r"^rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)$", color)
+    rgb_match = _RGB_RE.match(color)
     if rgb_match:
-        return tuple(map(int, rgb_match.groups()))
+        rgb = tuple(map(int, rgb_match.groups()))
+        if max(rgb) > 255:
+            return None
+        return rgb
 
     return None
 
 
+def parse_color(color: str) -> tuple[int, ...] | None:
+    """Parse color string to RGB tuple (memoized; common colors repeat)."""
+    color = color.strip().lower()
+    if len(color) > _MAX_COLOR_LEN:
+        return None
+    return _parse_normalized_color(color)
+
+
 @router.get("/", response_class=HTMLResponse)
 async def color_picker_page(request: Request):
     """Render color picker page."""
@@ -141,7 +168,7 @@ async def convert_color(
         rgb = parse_color(color)
         if not rgb:
             # Try to interpret as raw hex if no # provided and valid length
-            if re.match(r"^[0-9a-f]{6}$", color):
+            if _RAW_HEX_RE.match(color):
                 rgb = hex_to_rgb(f"#{color}")
             else:
                 return templates.TemplateResponse(
@@ -160,51 +187,14 @@ async def convert_color(
         # Generate Palette
         h, s, lightness = hsl
         palette = {
-            "complementary": [
-                rgb_to_hex(
-                    *map(
-                        lambda x: int(x * 255),
-                        colorsys.hls_to_rgb(
-                            (h + 180) % 360 / 360, lightness / 100, s / 100
-                        ),
-                    )
-                )
-            ],
+            "complementary": [_palette_hex(h + 180, lightness, s)],
             "analogous": [
-                rgb_to_hex(
-                    *map(
-                        lambda x: int(x * 255),
-                        colorsys.hls_to_rgb(
-                            (h - 30) % 360 / 360, lightness / 100, s / 100
-                        ),
-                    )
-                ),
-                rgb_to_hex(
-                    *map(
-                        lambda x: int(x * 255),
-                        colorsys.hls_to_rgb(
-                            (h + 30) % 360 / 360, lightness / 100, s / 100
-                        ),
-                    )
-                ),
+                _palette_hex(h - 30, lightness, s),
+                _palette_hex(h + 30, lightness, s),
             ],
             "monochromatic": [
-                rgb_to_hex(
-                    *map(
-                        lambda x: int(x * 255),
-                        colorsys.hls_to_rgb(
-                            h / 360, max(0, lightness - 20) / 100, s / 100
-                        ),
-                    )
-                ),
-                rgb_to_hex(
-                    *map(
-                        lambda x: int(x * 255),
-                        colorsys.hls_to_rgb(
-                            h / 360, min(100, lightness + 20) / 100, s / 100
-                        ),
-                    )
-                ),
+                _palette_hex(h, max(0, lightness - 20), s),
+                _palette_hex(h, min(100, lightness + 20), s),
             ],
         }
 
@@ -215,19 +205,19 @@ async def convert_color(
             {"color": color, "hex": hex_val},
         )
 
-        return templates.TemplateResponse(
-            request=request,
-            name="partials/result.html",
-            context={
-                "hex": hex_val,
-                "rgb": f"rgb({r}, {g}, {b})",
-                "hsl": f"hsl({h}, {s}%, {lightness}%)",
-                "cmyk": f"cmyk({cmyk[0]}%, {cmyk[1]}%, {cmyk[2]}%, {cmyk[3]}%)",
-                "r": r,
-                "g": g,
-                "b": b,
-                "palette": palette,
-            },
+        # The partial never reads `request`; render it directly and skip
+        # building a TemplateResponse
+        return HTMLResponse(
+            templates.get_template("partials/result.html").render(
+                hex=hex_val,
+                rgb=f"rgb({r}, {g}, {b})",
+                hsl=f"hsl({h}, {s}%, {lightness}%)",
+                cmyk=f"cmyk({cmyk[0]}%, {cmyk[1]}%, {cmyk[2]}%, {cmyk[3]}%)",
+                r=r,
+                g=g,
+                b=b,
+                palette=palette,
+            )
         )
 
     except Exception as e:
@@ -2,16 +2,26 @@
 Hash Generator Tool - Hash Üretici
 
 Metin ve dosyalar için hash üretici.
-Desteklenen algoritmalar: MD5, SHA1, SHA256, SHA512, BLAKE2b
+Desteklenen algoritmalar: MD5, SHA1, SHA256, SHA512, BLAKE2b, BLAKE3
 """
 
+import asyncio
 import hashlib
+import hmac
+import io
+import mmap
+import os
+import queue
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO
 
+import blake3
 from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
 from fastapi.responses import HTMLResponse
 
 from app.core.config import settings
+from app.core.metrics import record_tool_call, record_tool_call_with_size
 from app.core.observability import log_tool_call
 from app.core.rate_limit import rate_limit_dependency
 from app.core.utils import get_tool_templates
@@ -46,6 +56,11 @@ ALGORITHMS = {
     },
     "sha512": {"name": "SHA-512", "bits": 512, "description": "Yüksek güvenlik"},
     "blake2b": {"name": "BLAKE2b", "bits": 512, "description": "Modern ve hızlı"},
+    "blake3": {
+        "name": "BLAKE3",
+        "bits": 256,
+        "description": "En hızlı (büyük dosyalar için önerilen)",
+    },
 }
 
 # Tool Registration
@@ -55,11 +70,11 @@ tool_info = ToolInfo(
     category=Category.SECURITY,
     icon='<svg class="w-full h-full" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12l2 2 4-4m5.618-4.016A11.955 11.955 0 0112 2.944a11.955 11.955 0 01-8.618 3.04A12.02 12.02 0 003 9c0 5.591 3.824 10.29 9 11.622 5.176-1.332 9-6.03 9-11.622 0-1.042-.133-2.052-.382-3.016z"></path></svg>',
     image_url="/static/images/hash_generator.png",
-    description="Metin ve dosyalar için hash üretici. MD5, SHA-1, SHA-256, SHA-512, BLAKE2b.",
+    description="Metin ve dosyalar için hash üretici. MD5, SHA-1, SHA-256, SHA-512, BLAKE2b, BLAKE3.",
     short_description="MD5, SHA-256 ve daha fazlası",
     detailed_description="Dosya bütünlüğü kontrolü ve güvenli hash üretimi için profesyonel araç.",
     seo_title="Online Hash Generator | MD5, SHA-256 Calculator | İsviçre Çakısı",
-    seo_description="Ücretsiz online hash üretici. MD5, SHA-1, SHA-256, SHA-512, BLAKE2b. Metin ve dosya hash hesaplama. Dosya bütünlüğü kontrolü.",
+    seo_description="Ücretsiz online hash üretici. MD5, SHA-1, SHA-256, SHA-512, BLAKE2b, BLAKE3. Metin ve dosya hash hesaplama. Dosya bütünlüğü kontrolü.",
     keywords="hash generator, md5, sha256, sha512, blake2, checksum, dosya doğrulama",
     long_description="""
 Hash Üretici, metin ve dosyalarınız için kriptografik hash değerleri hesaplayan güvenlik aracıdır.
@@ -70,6 +85,7 @@ Hash Üretici, metin ve dosyalarınız için kriptografik hash değerleri hesapl
 - **SHA-256**: 256-bit, günümüzün standardı, blockchain ve SSL'de kullanılır
 - **SHA-512**: 512-bit, maksimum güvenlik
 - **BLAKE2b**: Modern, SHA-3 finalistlerinden, çok hızlı
+- **BLAKE3**: 256-bit, SIMD ile paralel çalışır, büyük dosyalarda en hızlısı
 
 **Kullanım Alanları:**
 Dosya indirme doğrulaması, veri bütünlüğü kontrolü, şifre hashleme (sadece SHA-256+).
@@ -84,7 +100,7 @@ Dosya indirme doğrulaması, veri bütünlüğü kontrolü, şifre hashleme (sad
     faq=[
         {
             "question": "Hangi hash algoritmasını kullanmalıyım?",
-            "answer": "Güvenlik için SHA-256 veya SHA-512 öneriyoruz. MD5 ve SHA-1 sadece eski sistem uyumluluğu için kullanın.",
+            "answer": "Güvenlik için SHA-256 veya SHA-512 öneriyoruz. Büyük dosyaların parmak izi ve yedek doğrulaması için BLAKE3 en hızlı seçenektir. MD5 ve SHA-1 sadece eski sistem uyumluluğu için kullanın.",
         },
         {
             "question": "Hash'ten orijinal veriyi geri alabilir miyim?",
@@ -103,19 +119,149 @@ Dosya indirme doğrulaması, veri bütünlüğü kontrolü, şifre hashleme (sad
 ToolRegistry.register(tool_info, router)
 
 
+# Uploads are hashed in 1 MiB chunks so peak memory stays at one chunk
+_CHUNK_SIZE = 1 << 20
+
+# Read buffers are reused across requests instead of allocating (and
+# page-faulting in) a fresh 1 MiB buffer per upload; at most this many idle
+_BUFFER_POOL_SIZE = 32
+_buffer_pool: queue.LifoQueue[bytearray] = queue.LifoQueue(maxsize=_BUFFER_POOL_SIZE)
+
+# On-disk uploads at least this large are memory-mapped instead of read
+_MMAP_MIN_SIZE = 10 * 1024 * 1024
+
+# hashlib releases the GIL while hashing, so with several cores the
+# algorithms can each hash a chunk on their own thread. Smaller chunks
+# don't cover the thread hand-off.
+_PARALLEL_MIN_SIZE = 64 * 1024
+_HASH_WORKERS = min(len(ALGORITHMS), os.cpu_count() or 1)
+
+# Shared by all requests, so concurrent uploads can't oversubscribe the CPU.
+# Worker threads only start on first use.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=_HASH_WORKERS, thread_name_prefix="hash"
+)
+
+
+# Direct constructors skip hashlib.new()'s per-call name lookup.
+# OpenSSL picks its SHA-NI/AVX2 code paths from CPUID at runtime, so the
+# SHA family needs no extra setup; BLAKE3 uses its own SIMD kernels.
+_HASH_CONSTRUCTORS = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+    "blake2b": hashlib.blake2b,
+    "blake3": blake3.blake3,
+}
+
+
+def _new_hasher(algorithm: str):
+    return _HASH_CONSTRUCTORS[algorithm]()
+
+
+class MultiHasher:
+    """Feeds data to several hashers at once, so input is traversed once."""
+
+    __slots__ = ("_hashers",)
+
+    def __init__(self, algorithms):
+        self._hashers = {algo: _new_hasher(algo) for algo in algorithms}
+
+    def update(self, data: bytes) -> None:
+        hashers = self._hashers.values()
+        if _HASH_WORKERS > 1 and len(hashers) > 1 and len(data) >= _PARALLEL_MIN_SIZE:
+            # Wait for every hasher: the caller may reuse the buffer next
+            for _ in _hash_executor.map(lambda h: h.update(data), hashers):
+                pass
+            return
+        for hasher in hashers:
+            hasher.update(data)
+
+    def hexdigests(self) -> dict[str, str]:
+        return {algo: hasher.hexdigest() for algo, hasher in self._hashers.items()}
+
+
 def calculate_hash(data: bytes, algorithm: str) -> str:
     """Calculate hash of data using specified algorithm."""
-    if algorithm == "blake2b":
-        hasher = hashlib.blake2b()
-    else:
-        hasher = hashlib.new(algorithm)
-    hasher.update(data)
-    return hasher.hexdigest()
+    return _HASH_CONSTRUCTORS[algorithm](data).hexdigest()
 
 
 def calculate_all_hashes(data: bytes) -> dict[str, str]:
     """Calculate all supported hashes for data."""
-    return {algo: calculate_hash(data, algo) for algo in ALGORITHMS.keys()}
+    hasher = MultiHasher(ALGORITHMS)
+    hasher.update(data)
+    return hasher.hexdigests()
+
+
+def _disk_fileno(stream: BinaryIO) -> int | None:
+    """File descriptor of a non-empty, disk-backed stream, or None."""
+    # Pipes, sockets and in-memory buffers either have no descriptor or
+    # report st_size 0; those take the buffered path
+    try:
+        stream.flush()
+        fileno = stream.fileno()
+        if os.fstat(fileno).st_size > 0:
+            return fileno
+    except (AttributeError, OSError, io.UnsupportedOperation, ValueError):
+        pass
+    return None
+
+
+def _hash_stream(
+    stream: BinaryIO, algorithms, max_size: int
+) -> tuple[dict[str, str], int] | None:
+    """
+    Hash a stream chunk by chunk; call it in a worker thread.
+    Returns (hashes, size), or None as soon as the stream exceeds max_size.
+    """
+    hasher = MultiHasher(algorithms)
+
+    fileno = _disk_fileno(stream)
+    if fileno is not None:
+        size = os.fstat(fileno).st_size
+        if size > max_size:
+            return None
+        if size >= _MMAP_MIN_SIZE:
+            # hashlib reads the mapped pages directly; slicing the view keeps
+            # each chunk cache-hot across hashers without copying it
+            with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    if tuple(algorithms) == ("blake3",):
+                        # BLAKE3 alone can split one input across cores with
+                        # its tree mode; hand it the whole mapping at once
+                        hasher = blake3.blake3(view, max_threads=blake3.blake3.AUTO)
+                        return {"blake3": hasher.hexdigest()}, size
+                    for offset in range(0, size, _CHUNK_SIZE):
+                        hasher.update(view[offset : offset + _CHUNK_SIZE])
+                finally:
+                    view.release()
+            return hasher.hexdigests(), size
+
+    # Same loop as hashlib.file_digest(), which only takes one algorithm:
+    # readinto() a reused buffer, so no bytes object is allocated per chunk.
+    # hashlib releases the GIL while hashing each chunk.
+    try:
+        buf = _buffer_pool.get_nowait()
+    except queue.Empty:
+        buf = bytearray(_CHUNK_SIZE)
+    view = memoryview(buf)
+    try:
+        size = 0
+        stream.seek(0)
+        while n := stream.readinto(buf):
+            size += n
+            if size > max_size:
+                return None
+            hasher.update(view[:n])
+        return hasher.hexdigests(), size
+    finally:
+        view.release()
+        try:
+            _buffer_pool.put_nowait(buf)
+        except queue.Full:
+            pass
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -161,12 +307,14 @@ async def hash_text(
                 )
             hashes = {algorithm: calculate_hash(data, algorithm)}
 
+        duration = (time.time() - start) * 1000
         log_tool_call(
             "hash-generator",
             "success",
-            (time.time() - start) * 1000,
+            duration,
             {"source": "text", "algorithm": algorithm},
         )
+        record_tool_call("hash-generator", "success", duration / 1000)
 
         return templates.TemplateResponse(
             request=request,
@@ -180,9 +328,9 @@ async def hash_text(
         )
 
     except Exception as e:
-        log_tool_call(
-            "hash-generator", "error", (time.time() - start) * 1000, {"error": str(e)}
-        )
+        duration = (time.time() - start) * 1000
+        log_tool_call("hash-generator", "error", duration, {"error": str(e)})
+        record_tool_call("hash-generator", "error", duration / 1000)
         return templates.TemplateResponse(
             request=request,
             name="partials/error.html",
@@ -200,14 +348,28 @@ async def hash_file(
     start = time.time()
 
     try:
-        # Read file
-        contents = await file.read()
+        if algorithm == "all":
+            algorithms = ALGORITHMS
+        elif algorithm in ALGORITHMS:
+            algorithms = (algorithm,)
+        else:
+            return templates.TemplateResponse(
+                request=request,
+                name="partials/error.html",
+                context={"error": f"Geçersiz algoritma: {algorithm}"},
+            )
 
         # Check size
         max_size = (
             (tool_info.max_upload_mb or settings.MAX_UPLOAD_SIZE_MB) * 1024 * 1024
         )
-        if len(contents) > max_size:
+        hashed = None
+        if file.size is None or file.size <= max_size:
+            # Stream the upload in a worker thread instead of reading it whole
+            hashed = await asyncio.to_thread(
+                _hash_stream, file.file, algorithms, max_size
+            )
+        if hashed is None:
             return templates.TemplateResponse(
                 request=request,
                 name="partials/error.html",
@@ -215,24 +377,16 @@ async def hash_file(
                     "error": f"Dosya çok büyük. Maksimum: {tool_info.max_upload_mb} MB"
                 },
             )
+        hashes, size = hashed
 
-        if algorithm == "all":
-            hashes = calculate_all_hashes(contents)
-        else:
-            if algorithm not in ALGORITHMS:
-                return templates.TemplateResponse(
-                    request=request,
-                    name="partials/error.html",
-                    context={"error": f"Geçersiz algoritma: {algorithm}"},
-                )
-            hashes = {algorithm: calculate_hash(contents, algorithm)}
-
+        duration = (time.time() - start) * 1000
         log_tool_call(
             "hash-generator",
             "success",
-            (time.time() - start) * 1000,
-            {"source": "file", "algorithm": algorithm, "size": len(contents)},
+            duration,
+            {"source": "file", "algorithm": algorithm, "size": size},
         )
+        record_tool_call_with_size("hash-generator", "success", duration / 1000, size)
 
         return templates.TemplateResponse(
             request=request,
@@ -242,14 +396,14 @@ async def hash_file(
                 "algorithms": ALGORITHMS,
                 "source": "file",
                 "filename": file.filename,
-                "input_size": len(contents),
+                "input_size": size,
             },
         )
 
     except Exception as e:
-        log_tool_call(
-            "hash-generator", "error", (time.time() - start) * 1000, {"error": str(e)}
-        )
+        duration = (time.time() - start) * 1000
+        log_tool_call("hash-generator", "error", duration, {"error": str(e)})
+        record_tool_call("hash-generator", "error", duration / 1000)
         return templates.TemplateResponse(
             request=request,
             name="partials/error.html",
@@ -270,14 +424,18 @@ async def compare_hash(
         hash1 = hash1.strip().lower()
         hash2 = hash2.strip().lower()
 
-        match = hash1 == hash2
+        # Constant-time compare; bytes, since compare_digest rejects
+        # non-ASCII str
+        match = hmac.compare_digest(hash1.encode(), hash2.encode())
 
+        duration = (time.time() - start) * 1000
         log_tool_call(
             "hash-generator",
             "success",
-            (time.time() - start) * 1000,
+            duration,
             {"action": "compare", "match": match},
         )
+        record_tool_call("hash-generator", "success", duration / 1000)
 
         return templates.TemplateResponse(
             request=request,
@@ -290,9 +448,9 @@ async def compare_hash(
         )
 
     except Exception as e:
-        log_tool_call(
-            "hash-generator", "error", (time.time() - start) * 1000, {"error": str(e)}
-        )
+        duration = (time.time() - start) * 1000
+        log_tool_call("hash-generator", "error", duration, {"error": str(e)})
+        record_tool_call("hash-generator", "error", duration / 1000)
         return templates.TemplateResponse(
             request=request,
             name="partials/error.html",
@@ -116,6 +116,7 @@ async def convert(
 ):
     import time
 
+    from app.core.metrics import record_tool_call, record_tool_call_with_size
     from app.core.observability import log_tool_call
 
     start_time = time.time()
@@ -136,6 +137,9 @@ async def convert(
             duration,
             {"size": original_size, "format": target_format},
         )
+        record_tool_call_with_size(
+            "image-converter", "success", duration / 1000, original_size
+        )
 
         # Tasarruf hesapla
         savings = original_size - new_size
@@ -181,6 +185,7 @@ async def convert(
     except Exception as e:
         duration = (time.time() - start_time) * 1000
         log_tool_call("image-converter", "error", duration, {"error": str(e)})
+        record_tool_call("image-converter", "error", duration / 1000)
 
         # Hata mesajını HTML olarak döndür
         error_msg = str(e.detail) if hasattr(e, "detail") else str(e)
@@ -1,12 +1,53 @@
+import asyncio
 from pathlib import Path
 
 from fastapi import HTTPException, UploadFile
 from PIL import Image
 
-from app.core.image_utils import save_image
+from app.core.image_utils import save_image, strip_metadata
 from app.core.upload import validate_and_load_image
 
 
+def _convert_and_save(
+    img: Image.Image,
+    filename: str,
+    target_format: str,
+    quality: int,
+    strip_exif: bool,
+) -> tuple[Path, str, int]:
+    """Pillow işlerini yapar; event loop'u bloklamamak için thread'de çalışır."""
+    # 2. EXIF Temizle
+    if strip_exif:
+        img = strip_metadata(img)
+
+    # 3. Format Hazırlığı
+    target_format = target_format.upper()
+
+    if target_format == "JPG":
+        target_format = "JPEG"
+        if img.mode in ("RGBA", "P"):
+            img = img.convert("RGB")
+    elif target_format == "WEBP":
+        if img.mode == "P":
+            img = img.convert("RGBA")
+    elif target_format == "ICO":
+        if img.mode not in ("RGBA",):
+            img = img.convert("RGBA")
+
+    # 4. Kaydet (Shared Logic)
+    save_kwargs = {}
+    if target_format in ("JPEG", "WEBP"):
+        save_kwargs["quality"] = quality
+    if target_format in ("JPEG", "PNG"):
+        save_kwargs["optimize"] = True
+
+    output_path, output_filename, new_size = save_image(
+        img, filename, target_format, **save_kwargs
+    )
+
+    return output_path, output_filename, new_size
+
+
 async def process_image(
     file: UploadFile | None,
     url: str | None,
@@ -28,36 +69,10 @@ async def process_image(
     img, filename, original_size = await validate_and_load_image(file)
 
     try:
-        # 2. EXIF Temizle
-        if strip_exif:
-            data = img.getdata()
-            img_without_exif = Image.new(img.mode, img.size)
-            img_without_exif.putdata(data)
-            img = img_without_exif
-
-        # 3. Format Hazırlığı
-        target_format = target_format.upper()
-
-        if target_format == "JPG":
-            target_format = "JPEG"
-            if img.mode in ("RGBA", "P"):
-                img = img.convert("RGB")
-        elif target_format == "WEBP":
-            if img.mode == "P":
-                img = img.convert("RGBA")
-        elif target_format == "ICO":
-            if img.mode not in ("RGBA",):
-                img = img.convert("RGBA")
-
-        # 4. Kaydet (Shared Logic)
-        save_kwargs = {}
-        if target_format in ("JPEG", "WEBP"):
-            save_kwargs["quality"] = quality
-        if target_format in ("JPEG", "PNG"):
-            save_kwargs["optimize"] = True
-
-        output_path, output_filename, new_size = save_image(
-            img, filename, target_format, **save_kwargs
+        # 2-4 run in a worker thread; decoding, conversion and encoding can
+        # take hundreds of ms on large images
+        output_path, output_filename, new_size = await asyncio.to_thread(
+            _convert_and_save, img, filename, target_format, quality, strip_exif
         )
 
         return output_path, output_filename, original_size, new_size
@@ -1,14 +1,17 @@
 """Image Cropper tool - simple manual cropping"""
 
+import asyncio
 import time
 import uuid
+from pathlib import Path
 
-from fastapi import APIRouter, Depends, Form, Request, UploadFile
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, HTMLResponse
 from PIL import Image
 
 from app.core.config import settings
 from app.core.rate_limit import rate_limit_dependency
+from app.core.upload import open_upload
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
 
@@ -84,6 +87,17 @@ async def page(request: Request, pipeline_id: str | None = None):
     )
 
 
+def _crop_and_save(source, box: tuple[int, int, int, int]) -> tuple[Path, str]:
+    """Crop the image to box and save it; returns (output path, format)."""
+    img = Image.open(source)
+    image_format = img.format or "PNG"
+    output = (
+        settings.TEMP_DIR / f"cropped_{uuid.uuid4().hex[:8]}.{image_format.lower()}"
+    )
+    img.crop(box).save(output, format=image_format)
+    return output, image_format
+
+
 @router.post("/crop", response_class=FileResponse)
 async def crop(
     request: Request,
@@ -100,27 +114,34 @@ async def crop(
 
     try:
         if pipeline_id:
-            from app.core.pipeline import resolve_pipeline_file
+            from app.core.pipeline import (
+                discard_pipeline_file,
+                resolve_pipeline_file,
+            )
 
             pf = resolve_pipeline_file(pipeline_id)
             if not pf:
-                raise ValueError("Pipeline dosyası bulunamadı")
-            file_path = pf["file_path"]
+                raise HTTPException(
+                    status_code=404, detail="Pipeline dosyası bulunamadı"
+                )
+            source = pf["file_path"]
         else:
             if not file or not file.content_type.startswith("image/"):
                 raise ValueError("Geçerli resim gerekli")
-            temp = settings.TEMP_DIR / f"crop_in_{file.filename}"
-            with open(temp, "wb") as f:
-                f.write(await file.read())
-            file_path = str(temp)
-
-        img = Image.open(file_path)
-        cropped = img.crop((x, y, x + width, y + height))
-        output = (
-            settings.TEMP_DIR
-            / f"cropped_{uuid.uuid4().hex[:8]}.{img.format.lower() if img.format else 'png'}"
-        )
-        cropped.save(output, format=img.format or "PNG")
+            # Pillow reads the spooled upload directly; no temp copy
+            source = open_upload(file, tool_info.max_upload_mb)
+
+        # Decode, crop and encode off the event loop
+        try:
+            output, image_format = await asyncio.to_thread(
+                _crop_and_save, source, (x, y, x + width, y + height)
+            )
+        except FileNotFoundError:
+            if not pipeline_id:
+                raise
+            # The pipeline file was deleted before its TTL
+            discard_pipeline_file(pipeline_id)
+            raise HTTPException(status_code=404, detail="Pipeline dosyası bulunamadı")
 
         # Pipeline production
         if tool_info.produces_pipeline_files:
@@ -130,8 +151,8 @@ async def crop(
                 create_pipeline_file(
                     "image-cropper",
                     str(output),
-                    f"image/{(img.format or 'png').lower()}",
-                    output.name,
+                    f"image/{image_format.lower()}",
+                    original_name=output.name,
                 )
             except Exception:
                 pass
@@ -140,7 +161,7 @@ async def crop(
         return FileResponse(
             path=output,
             filename=output.name,
-            media_type=f"image/{img.format.lower() if img.format else 'png'}",
+            media_type=f"image/{image_format.lower()}",
         )
     except Exception as e:
         log_tool_call(
@@ -8,7 +8,9 @@ from PIL import Image
 from PIL.ExifTags import TAGS
 
 from app.core.config import settings
+from app.core.image_utils import strip_metadata
 from app.core.rate_limit import rate_limit_dependency
+from app.core.upload import save_upload
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
 
@@ -127,7 +129,10 @@ async def inspect_metadata(
     try:
         # Get file (upload or pipeline)
         if pipeline_id:
-            from app.core.pipeline import resolve_pipeline_file
+            from app.core.pipeline import (
+                discard_pipeline_file,
+                resolve_pipeline_file,
+            )
 
             pipeline_data = resolve_pipeline_file(pipeline_id)
             if not pipeline_data:
@@ -143,13 +148,19 @@ async def inspect_metadata(
             if not file.content_type.startswith("image/"):
                 raise ValueError("Sadece resim dosyaları kabul edilir")
             temp_path = settings.TEMP_DIR / f"metadata_{file.filename}"
-            with open(temp_path, "wb") as f:
-                f.write(await file.read())
+            await save_upload(file, temp_path, tool_info.max_upload_mb)
             file_path = str(temp_path)
             filename = file.filename
 
         # Extract metadata using PIL's getexif()
-        img = Image.open(file_path)
+        try:
+            img = Image.open(file_path)
+        except FileNotFoundError:
+            if not pipeline_id:
+                raise
+            # The pipeline file was deleted before its TTL
+            discard_pipeline_file(pipeline_id)
+            raise ValueError("Pipeline dosyası bulunamadı veya süresi dolmuş")
         metadata_items = []
         has_exif = False
 
@@ -226,9 +237,8 @@ async def clean_metadata(
         # Load image
         img = Image.open(file_path)
 
-        # Create new image without EXIF
-        img_clean = Image.new(img.mode, img.size)
-        img_clean.putdata(list(img.getdata()))
+        # Drop EXIF without a per-pixel copy
+        img_clean = strip_metadata(img)
 
         # Save
         output_filename = (
@@ -4,8 +4,10 @@ import time
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
 
+from app.core.cache import get_cached_by_key, make_cache_key, set_cached_by_key
 from app.core.config import settings
-from app.core.observability import log_tool_call
+from app.core.metrics import record_tool_call
+from app.core.observability import log_tool_call, record_page_view
 from app.core.rate_limit import rate_limit_dependency
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
@@ -84,7 +86,6 @@ ToolRegistry.register(tool_info, router)
 @router.get("/", response_class=HTMLResponse)
 async def page(request: Request):
     # v0.7.0: Analytics tracking
-    from app.core.observability import record_page_view
 
     record_page_view(
         "json-formatter",
@@ -103,21 +104,21 @@ async def format_json(
     json_input: str = Form(...),
     action: str = Form(...),  # "prettify" or "minify"
 ):
-    from app.core.cache import get_cached_result, set_cached_result
-    from app.core.rate_limit import rate_limit_dependency
 
     # Rate limiting applied
     await rate_limit_dependency(request)
 
     start_time = time.time()
     try:
-        # Check cache first
-        cached = get_cached_result("json-formatter", json_input, action=action)
+        # Check cache first; the key is hashed once and reused for the store
+        cache_key = make_cache_key("json-formatter", json_input, action=action)
+        cached = cache_key and get_cached_by_key("json-formatter", cache_key)
 
         if cached:
             log_tool_call(
                 "json-formatter", "success", 0, {"action": action, "cached": True}
             )
+            record_tool_call("json-formatter", "success", 0)
             return f"""
             <div class="bg-slate-900 rounded-lg border border-slate-700 overflow-hidden animate-fade-in">
                 <div class="flex items-center justify-between px-4 py-2 bg-slate-800 border-b border-slate-700">
@@ -139,7 +140,8 @@ async def format_json(
             result = json.dumps(parsed, separators=(",", ":"), ensure_ascii=False)
 
         # Cache the result
-        set_cached_result("json-formatter", json_input, result, action=action)
+        if cache_key:
+            set_cached_by_key("json-formatter", cache_key, result)
 
         duration = (time.time() - start_time) * 1000
         log_tool_call(
@@ -148,6 +150,7 @@ async def format_json(
             duration,
             {"action": action, "size": len(json_input)},
         )
+        record_tool_call("json-formatter", "success", duration / 1000)
 
         return f"""
         <div class="bg-slate-900 rounded-lg border border-slate-700 overflow-hidden animate-fade-in">
@@ -163,6 +166,7 @@ async def format_json(
     except json.JSONDecodeError as e:
         duration = (time.time() - start_time) * 1000
         log_tool_call("json-formatter", "error", duration, {"error": str(e)})
+        record_tool_call("json-formatter", "error", duration / 1000)
 
         return f"""
         <div class="bg-red-500/10 border border-red-500/50 rounded-xl p-4 animate-fade-in">
@@ -173,6 +177,7 @@ async def format_json(
     except Exception as e:
         duration = (time.time() - start_time) * 1000
         log_tool_call("json-formatter", "error", duration, {"error": str(e)})
+        record_tool_call("json-formatter", "error", duration / 1000)
         return f"""
         <div class="bg-red-500/10 border border-red-500/50 rounded-xl p-4 animate-fade-in">
             <p class="text-red-300 text-sm">Beklenmeyen bir hata oluştu: {str(e)}</p>
@@ -120,13 +120,8 @@ async def merge(
         merger = PdfWriter()
 
         for file in files:
-            content = await validate_pdf(file)
-
-            # Write to temp file for pypdf (it handles file objects better)
-            # But pypdf can also handle BytesIO. Let's try BytesIO first to avoid too many temp files.
-            from io import BytesIO
-
-            merger.append(BytesIO(content))
+            # pypdf reads straight from the spooled upload; no in-memory copy
+            merger.append(await validate_pdf(file))
 
         # Save merged file
         output_filename = f"merged_{uuid.uuid4().hex[:8]}.pdf"
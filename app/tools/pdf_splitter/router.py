@@ -3,12 +3,13 @@
 import time
 import uuid
 
-from fastapi import APIRouter, Depends, Form, Request, UploadFile
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, UploadFile
 from fastapi.responses import FileResponse, HTMLResponse
 from pypdf import PdfReader, PdfWriter
 
 from app.core.config import settings
 from app.core.rate_limit import rate_limit_dependency
+from app.core.upload import save_upload
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
 
@@ -107,21 +108,32 @@ async def split(
 
     try:
         if pipeline_id:
-            from app.core.pipeline import resolve_pipeline_file
+            from app.core.pipeline import (
+                discard_pipeline_file,
+                resolve_pipeline_file,
+            )
 
             pf = resolve_pipeline_file(pipeline_id)
             if not pf:
-                raise ValueError("Pipeline dosyası bulunamadı")
+                raise HTTPException(
+                    status_code=404, detail="Pipeline dosyası bulunamadı"
+                )
             file_path = pf["file_path"]
         else:
             if not file or file.content_type != "application/pdf":
                 raise ValueError("Geçerli PDF gerekli")
             temp = settings.TEMP_DIR / f"split_in_{file.filename}"
-            with open(temp, "wb") as f:
-                f.write(await file.read())
+            await save_upload(file, temp, tool_info.max_upload_mb)
             file_path = str(temp)
 
-        reader = PdfReader(file_path)
+        try:
+            reader = PdfReader(file_path)
+        except FileNotFoundError:
+            if not pipeline_id:
+                raise
+            # The pipeline file was deleted before its TTL
+            discard_pipeline_file(pipeline_id)
+            raise HTTPException(status_code=404, detail="Pipeline dosyası bulunamadı")
         selected = parse_pages(pages, len(reader.pages))
         if not selected:
             raise ValueError("Geçerli sayfa numarası belirtilmedi")
@@ -140,7 +152,10 @@ async def split(
 
             try:
                 create_pipeline_file(
-                    "pdf-splitter", str(output), "application/pdf", output.name
+                    "pdf-splitter",
+                    str(output),
+                    "application/pdf",
+                    original_name=output.name,
                 )
             except Exception:
                 pass
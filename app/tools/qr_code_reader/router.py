@@ -9,6 +9,7 @@ from fastapi.responses import HTMLResponse
 
 from app.core.config import settings
 from app.core.rate_limit import rate_limit_dependency
+from app.core.upload import read_upload
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
 
@@ -125,7 +126,10 @@ async def read_qr(
     try:
         # Get file (upload or pipeline)
         if pipeline_id:
-            from app.core.pipeline import resolve_pipeline_file
+            from app.core.pipeline import (
+                discard_pipeline_file,
+                resolve_pipeline_file,
+            )
 
             pipeline_data = resolve_pipeline_file(pipeline_id)
             if not pipeline_data:
@@ -140,7 +144,7 @@ async def read_qr(
                 raise ValueError("Sadece resim dosyaları kabul edilir")
 
             # Read file content directly into memory
-            contents = await file.read()
+            contents = await read_upload(file, tool_info.max_upload_mb)
             nparr = np.frombuffer(contents, np.uint8)
             img = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
 
@@ -159,6 +163,10 @@ async def read_qr(
         if pipeline_id:
             img = cv2.imread(file_path)
             if img is None:
+                # imread returns None instead of raising for a missing file
+                if not os.path.exists(file_path):
+                    discard_pipeline_file(pipeline_id)
+                    raise ValueError("Pipeline dosyası bulunamadı veya süresi dolmuş")
                 raise ValueError("Pipeline dosyası okunamadı")
 
         # Detect and Decode
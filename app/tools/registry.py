@@ -1,3 +1,4 @@
+import threading
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List
@@ -73,14 +74,29 @@ class ToolInfo:
 class ToolRegistry:
     _tools: List[ToolInfo] = []
     _routers: List[APIRouter] = []
+    # Tool modules may be imported from several threads at startup
+    _lock = threading.Lock()
 
     @classmethod
     def register(cls, info: ToolInfo, router: APIRouter):
         """Registers a new tool with its metadata and router."""
-        cls._tools.append(info)
-        cls._routers.append(router)
+        with cls._lock:
+            cls._tools.append(info)
+            cls._routers.append(router)
         print(f"Tool registered: {info.title} ({info.slug})")
 
+    @classmethod
+    def reorder(cls, slugs: List[str]) -> None:
+        """Sorts registered tools (and their routers) into the given slug order."""
+        rank = {slug: i for i, slug in enumerate(slugs)}
+        with cls._lock:
+            pairs = sorted(
+                zip(cls._tools, cls._routers),
+                key=lambda pair: rank.get(pair[0].slug, len(rank)),
+            )
+            cls._tools[:] = [info for info, _ in pairs]
+            cls._routers[:] = [router for _, router in pairs]
+
     @classmethod
     def get_tools(cls) -> List[ToolInfo]:
         return cls._tools
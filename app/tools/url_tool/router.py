@@ -4,8 +4,10 @@ import urllib.parse
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse
 
+from app.core.cache import get_cached_by_key, make_cache_key, set_cached_by_key
 from app.core.config import settings
-from app.core.observability import log_tool_call
+from app.core.metrics import record_tool_call
+from app.core.observability import log_tool_call, record_page_view
 from app.core.rate_limit import rate_limit_dependency
 from app.core.utils import get_tool_templates
 from app.tools.registry import Category, ToolInfo, ToolRegistry, ToolRelation
@@ -78,7 +80,6 @@ ToolRegistry.register(tool_info, router)
 @router.get("/", response_class=HTMLResponse)
 async def page(request: Request):
     # v0.7.0: Analytics tracking
-    from app.core.observability import record_page_view
 
     record_page_view(
         "url-encoder", request.headers.get("user-agent"), request.headers.get("referer")
@@ -95,20 +96,20 @@ async def convert_url(
     text_input: str = Form(...),
     action: str = Form(...),  # "encode" or "decode"
 ):
-    from app.core.cache import get_cached_result, set_cached_result
-    from app.core.rate_limit import rate_limit_dependency
 
     # Rate limiting
     await rate_limit_dependency(request)
 
     start_time = time.time()
     try:
-        # Check cache
-        cached = get_cached_result("url-encoder", text_input, action=action)
+        # Check cache; the key is hashed once and reused for the store
+        cache_key = make_cache_key("url-encoder", text_input, action=action)
+        cached = cache_key and get_cached_by_key("url-encoder", cache_key)
         if cached:
             log_tool_call(
                 "url-encoder", "success", 0, {"action": action, "cached": True}
             )
+            record_tool_call("url-encoder", "success", 0)
             return f"""
             <div class="bg-slate-900 rounded-lg border border-slate-700 overflow-hidden animate-fade-in">
                 <div class="flex items-center justify-between px-4 py-2 bg-slate-800 border-b border-slate-700">
@@ -177,7 +178,8 @@ async def convert_url(
                 result = urllib.parse.unquote(text_input)
 
         # Set cache
-        set_cached_result("url-encoder", text_input, result, action=action)
+        if cache_key:
+            set_cached_by_key("url-encoder", cache_key, result)
 
         duration = (time.time() - start_time) * 1000
         log_tool_call(
@@ -186,6 +188,7 @@ async def convert_url(
             duration,
             {"action": action, "size": len(text_input)},
         )
+        record_tool_call("url-encoder", "success", duration / 1000)
 
         return f"""
         <div class="bg-slate-900 rounded-lg border border-slate-700 overflow-hidden animate-fade-in">
@@ -201,6 +204,7 @@ async def convert_url(
     except Exception as e:
         duration = (time.time() - start_time) * 1000
         log_tool_call("url-encoder", "error", duration, {"error": str(e)})
+        record_tool_call("url-encoder", "error", duration / 1000)
 
         return f"""
         <div class="bg-red-500/10 border border-red-500/50 rounded-xl p-4 animate-fade-in">
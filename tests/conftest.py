@@ -1,7 +1,23 @@
+import os
+import shutil
+import tempfile
+
 import pytest
 from fastapi.testclient import TestClient
 
-from app.main import app
+# Tool outputs go to settings.TEMP_DIR; point it at a throwaway directory
+# before the app (and its frozen settings) is imported, so test runs don't
+# litter the repo's temp/ folder.
+_TEST_TEMP_DIR = tempfile.mkdtemp(prefix="isvicre-cakisi-tests-")
+os.environ["TEMP_DIR"] = _TEST_TEMP_DIR
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _remove_test_temp_dir():
+    yield
+    shutil.rmtree(_TEST_TEMP_DIR, ignore_errors=True)
 
 
 @pytest.fixture
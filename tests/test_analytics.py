@@ -90,3 +90,41 @@ def test_analytics_with_user_agent_and_referer():
 
     stats = get_analytics_stats()
     assert stats["total_page_views"] == 1
+
+
+def test_tool_stats_skip_uncalled_registered_tools():
+    """Tools pre-registered by init_stats only appear once called"""
+    from app.core.observability import get_stats, init_stats, log_tool_call, reset_stats
+
+    reset_stats()
+    try:
+        init_stats(["test-tool", "idle-tool"])
+        log_tool_call("test-tool", "success", 10.0)
+        log_tool_call("new-tool", "error", 5.0, {"error": "boom"})
+
+        stats = get_stats()
+
+        assert stats["total_calls"] == 2
+        assert set(stats["by_tool"]) == {"test-tool", "new-tool"}
+        assert stats["by_tool"]["new-tool"]["errors"] == 1
+        assert stats["by_tool"]["new-tool"]["rate_limits"] == 0
+    finally:
+        reset_stats()
+
+
+def test_tool_stats_snapshot_reused_until_write():
+    """get_stats returns the cached payload until stats change"""
+    from app.core.observability import get_stats, log_tool_call, reset_stats
+
+    reset_stats()
+    try:
+        log_tool_call("test-tool", "success", 10.0)
+        first = get_stats()
+        assert get_stats() is first
+
+        log_tool_call("test-tool", "success", 20.0)
+        second = get_stats()
+        assert second is not first
+        assert second["by_tool"]["test-tool"]["calls"] == 2
+    finally:
+        reset_stats()
@@ -37,3 +37,111 @@ def test_cache_key_generation():
 
     assert key1 == key2
     assert key1 != key3
+    # Compact 8-byte BLAKE2b digest rendered as hex
+    assert len(key1) == 16
+
+
+def test_cache_skips_oversized_input():
+    from app.core.config import settings
+
+    clear_cache()
+    big_input = "x" * (settings.CACHE_MAX_INPUT_BYTES + 1)
+
+    set_cached_result("json-formatter", big_input, "result")
+
+    assert get_cached_result("json-formatter", big_input) is None
+
+
+def test_cache_key_reused_for_lookup_and_store():
+    from app.core.cache import get_cached_by_key, make_cache_key, set_cached_by_key
+    from app.core.config import settings
+
+    clear_cache()
+    key = make_cache_key("url-encoder", "a b", action="encode")
+    assert get_cached_by_key("url-encoder", key) is None
+
+    set_cached_by_key("url-encoder", key, "a%20b")
+
+    assert get_cached_by_key("url-encoder", key) == "a%20b"
+    assert get_cached_result("url-encoder", "a b", action="encode") == "a%20b"
+    big_input = "x" * (settings.CACHE_MAX_INPUT_BYTES + 1)
+    assert make_cache_key("url-encoder", big_input) is None
+
+
+def test_lru_cache_eviction_order():
+    from app.core.cache import LRUCache
+
+    cache = LRUCache(max_size=2)
+    cache.put("a", "1")
+    cache.put("b", "2")
+
+    # Touch "a" so "b" becomes the least recently used entry
+    assert cache.get("a") == "1"
+    cache.put("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert cache.size() == 2
+
+
+def test_cache_lookup_records_metrics():
+    from app.core.metrics import CACHE_HITS, CACHE_MISSES
+
+    clear_cache()
+    hits = CACHE_HITS.labels(tool_slug="base64")
+    misses = CACHE_MISSES.labels(tool_slug="base64")
+    hits_before, misses_before = hits._value.get(), misses._value.get()
+
+    assert get_cached_result("base64", "metrics-input") is None
+    set_cached_result("base64", "metrics-input", "result")
+    assert get_cached_result("base64", "metrics-input") == "result"
+
+    assert misses._value.get() == misses_before + 1
+    assert hits._value.get() == hits_before + 1
+
+
+def test_cache_key_separator_does_not_collide():
+    from app.core.cache import _generate_cache_key
+
+    # Input containing the old "|k=v" suffix must not alias an option
+    assert _generate_cache_key("tool", "input|action=encode") != _generate_cache_key(
+        "tool", "input", action="encode"
+    )
+
+
+def test_cache_key_single_option_matches_sorted_order():
+    import hashlib
+
+    from app.core.cache import _generate_cache_key
+
+    # One option skips the sort; the key must match the sorted-order layout
+    expected = hashlib.blake2b(digest_size=8)
+    for part in (b"base64", b"x", b"action=encode"):
+        if part != b"base64":
+            expected.update(b"\x1f")
+        expected.update(part)
+    assert _generate_cache_key("base64", "x", action="encode") == expected.hexdigest()
+
+    # Several options are still order-independent
+    assert _generate_cache_key(
+        "base64", "x", action="encode", extra=1
+    ) == _generate_cache_key("base64", "x", extra=1, action="encode")
+
+
+def test_lru_cache_byte_bound():
+    from app.core.cache import LRUCache
+
+    # Each entry is 1 (key) + 4 (value) = 5 units
+    cache = LRUCache(max_size=100, max_bytes=10)
+    cache.put("a", "aaaa")
+    cache.put("b", "bbbb")
+    cache.put("c", "cccc")
+
+    assert cache.get("a") is None
+    assert cache.size() == 2
+
+    # Entries larger than the whole budget are skipped without evicting others
+    cache.put("d", "x" * 20)
+    assert cache.get("d") is None
+    assert cache.size() == 2
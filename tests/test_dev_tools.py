@@ -46,6 +46,15 @@ def test_base64_decode(client):
     assert "hello" in response.text
 
 
+def test_base64_decode_escapes_html(client):
+    # base64 of "<script>x</script>"
+    data = {"text_input": "PHNjcmlwdD54PC9zY3JpcHQ+", "action": "decode"}
+    response = client.post("/tools/base64/convert", data=data)
+    assert response.status_code == 200
+    assert "<script>" not in response.text
+    assert "&lt;script&gt;x&lt;/script&gt;" in response.text
+
+
 def test_url_tool_page(client):
     response = client.get("/tools/url-encoder/")
     assert response.status_code == 200
@@ -156,3 +165,19 @@ def test_url_safe_characters_preserved(client):
     assert "a=1&b=2" in response.text
     assert "_" in response.text or "%5F" in response.text  # underscore
     assert "-" in response.text  # hyphen should be safe
+
+
+def test_color_picker_rgb_to_hex(client):
+    response = client.post(
+        "/tools/color-picker/convert", data={"color": "rgb(255, 0, 16)"}
+    )
+    assert response.status_code == 200
+    assert "#ff0010" in response.text
+
+
+def test_color_picker_rgb_out_of_range(client):
+    response = client.post(
+        "/tools/color-picker/convert", data={"color": "rgb(300, 0, 0)"}
+    )
+    assert response.status_code == 200
+    assert "Geçersiz renk formatı" in response.text
@@ -126,3 +126,55 @@ class TestHealthModule:
         ready, reason = is_ready()
         assert ready is True
         assert "araç hazır" in reason
+
+
+class TestMetricsModule:
+    """Tests for metrics module helpers."""
+
+    def test_normalize_endpoint(self):
+        """Test that dynamic paths collapse to low-cardinality labels."""
+        from app.core.metrics import normalize_endpoint
+
+        assert normalize_endpoint("/tools/base64") == "/tools/base64"
+        assert normalize_endpoint("/tools/base64/convert?x=1") == "/tools/base64/action"
+        assert normalize_endpoint("/static/images/a.png") == "/static/{file}"
+        assert normalize_endpoint("/health?verbose=1") == "/health"
+
+    def test_record_tool_call_increments_counter(self):
+        """Test that cached label children still update the shared metric."""
+        from app.core.metrics import TOOL_CALLS, record_tool_call
+
+        before = TOOL_CALLS.labels(
+            tool_slug="metrics-test", status="success"
+        )._value.get()
+        record_tool_call("metrics-test", "success", 0.01)
+        record_tool_call("metrics-test", "success", 0.01)
+
+        after = TOOL_CALLS.labels(
+            tool_slug="metrics-test", status="success"
+        )._value.get()
+        assert after == before + 2
+
+    def test_record_tool_call_with_size_observes_file_size(self):
+        """Test that file-based calls also feed the file size histogram."""
+        from app.core.metrics import TOOL_FILE_SIZE, record_tool_call_with_size
+
+        before = TOOL_FILE_SIZE.labels(tool_slug="metrics-test")._sum.get()
+        record_tool_call_with_size("metrics-test", "success", 0.01, 2048)
+
+        assert (
+            TOOL_FILE_SIZE.labels(tool_slug="metrics-test")._sum.get() == before + 2048
+        )
+
+    def test_tool_router_records_tool_call(self, client):
+        """Test that tool endpoints feed the Prometheus tool counters."""
+        from app.core.metrics import TOOL_CALLS
+
+        counter = TOOL_CALLS.labels(tool_slug="hash-generator", status="success")
+        before = counter._value.get()
+        response = client.post(
+            "/tools/hash-generator/text", data={"text": "merhaba", "algorithm": "md5"}
+        )
+
+        assert response.status_code == 200
+        assert counter._value.get() == before + 1
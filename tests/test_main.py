@@ -17,3 +17,45 @@ def test_admin_stats(client):
     # Should return HTML in dev mode
     assert "text/html" in response.headers.get("content-type", "")
     assert "Admin Dashboard" in response.text
+
+
+def test_tool_registration_follows_package_order():
+    """Parallel autodiscovery must keep the package-directory order"""
+    import pkgutil
+    import sys
+
+    import app.tools as tools_pkg
+    from app.tools.registry import ToolRegistry
+
+    expected = [
+        sys.modules[f"app.tools.{name}.router"].tool_info.slug
+        for _, name, is_pkg in pkgutil.iter_modules(tools_pkg.__path__)
+        if is_pkg
+    ]
+    assert [tool.slug for tool in ToolRegistry.get_tools()] == expected
+
+
+def test_tool_manifest_matches_packages():
+    """The static tool manifest must list every tool package"""
+    import pkgutil
+
+    import app.tools as tools_pkg
+    from app.tools._tool_manifest import TOOL_MODULES
+
+    packages = [
+        name for _, name, is_pkg in pkgutil.iter_modules(tools_pkg.__path__) if is_pkg
+    ]
+    assert list(TOOL_MODULES) == packages
+
+
+def test_log_level_setting_is_validated():
+    import logging
+
+    import pytest
+    from pydantic import ValidationError
+
+    from app.core.config import Settings
+
+    assert Settings(LOG_LEVEL="warning").log_level == logging.WARNING
+    with pytest.raises(ValidationError, match="Unknown LOG_LEVEL"):
+        Settings(LOG_LEVEL="verbose")
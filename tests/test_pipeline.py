@@ -163,3 +163,92 @@ def test_pipeline_file_copy_not_move(sample_file):
 
     # Cleanup
     cleanup_expired_pipeline_files()
+
+
+def test_pipeline_file_survives_source_removal(sample_file):
+    """Pipeline storage keeps the content after the tool output is deleted"""
+    pipeline_id = create_pipeline_file(
+        source_tool_slug="test-tool",
+        input_file_path=sample_file,
+        mime_type="text/plain",
+    )
+    os.remove(sample_file)
+
+    metadata = resolve_pipeline_file(pipeline_id)
+    assert metadata is not None
+    with open(metadata["file_path"]) as f:
+        assert f.read() == "Test pipeline content"
+
+
+def test_pipeline_store_is_bounded(sample_file, monkeypatch):
+    """Creating past the cap evicts the soonest-expiring file"""
+    from app.core import pipeline
+
+    monkeypatch.setattr(pipeline, "_pipeline_store", {})
+    monkeypatch.setattr(pipeline, "_expiry_heap", [])
+    monkeypatch.setattr(pipeline, "_MAX_PIPELINE_FILES", 2)
+
+    first = create_pipeline_file("test-tool", sample_file, "text/plain", ttl_seconds=5)
+    second = create_pipeline_file("test-tool", sample_file, "text/plain")
+    third = create_pipeline_file("test-tool", sample_file, "text/plain")
+
+    assert resolve_pipeline_file(first) is None
+    assert resolve_pipeline_file(second) is not None
+    assert resolve_pipeline_file(third) is not None
+
+
+def test_missing_pipeline_file_is_discarded(client, sample_file):
+    """A pipeline file deleted before its TTL yields the not-found error once"""
+    pipeline_id = create_pipeline_file("image-resizer", sample_file, "image/png")
+    os.remove(resolve_pipeline_file(pipeline_id)["file_path"])
+
+    response = client.post(
+        f"/tools/image-cropper/crop?pipeline_id={pipeline_id}",
+        data={"width": "1", "height": "1"},
+    )
+    assert response.status_code == 404
+    assert "Pipeline dosyası bulunamadı" in response.text
+    assert resolve_pipeline_file(pipeline_id) is None
+
+
+def test_cropper_output_is_pipelined(client, monkeypatch):
+    """The cropper hands its output to the pipeline with the default TTL"""
+    import io
+
+    from PIL import Image
+
+    from app.core import pipeline
+
+    monkeypatch.setattr(pipeline, "_pipeline_store", {})
+    monkeypatch.setattr(pipeline, "_expiry_heap", [])
+
+    src = io.BytesIO()
+    Image.new("RGB", (8, 8), (0, 128, 255)).save(src, "PNG")
+    response = client.post(
+        "/tools/image-cropper/crop",
+        files={"file": ("in.png", src.getvalue(), "image/png")},
+        data={"width": "4", "height": "4"},
+    )
+    assert response.status_code == 200
+
+    (entry,) = pipeline._pipeline_store.values()
+    assert entry.source_tool_slug == "image-cropper"
+    assert entry.ttl_seconds == 600
+    assert entry.original_name.startswith("cropped_")
+
+
+def test_failed_copy_leaves_no_orphan(sample_file, monkeypatch):
+    """A copy that fails midway removes its partial file"""
+    from app.core import pipeline
+
+    def broken_copy(src, dst):
+        dst.write_bytes(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(pipeline, "_clone_or_copy", broken_copy)
+    before = set(pipeline._get_pipeline_dir().iterdir())
+
+    with pytest.raises(OSError):
+        create_pipeline_file("test-tool", sample_file, "text/plain")
+
+    assert set(pipeline._get_pipeline_dir().iterdir()) == before
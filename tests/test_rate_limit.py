@@ -1,5 +1,3 @@
-import time
-
 import pytest
 from fastapi import Request
 
@@ -23,24 +21,49 @@ async def test_rate_limit_dependency():
     # But we can verify the function exists and runs without error for a single request
 
 
-def test_rate_limit_logic():
+def test_rate_limit_logic(monkeypatch):
+    from fastapi import HTTPException
+
+    from app.core.config import settings
     from app.core.rate_limit import rate_limiter
 
     reset_rate_limits()
     ip = "192.168.1.1"
+    # Force the in-memory fallback
+    monkeypatch.setattr(rate_limiter, "_incr_redis_request_count", lambda ip: None)
+    request = Request({"type": "http", "client": (ip, 12345), "headers": []})
 
-    # Simulate requests
-    now = time.time()
-    rate_limiter._request_times[ip].append(now)
+    # Simulate requests up to the limit
+    for _ in range(settings.MAX_REQUESTS_PER_MINUTE):
+        rate_limiter.check_rate_limit(request)
 
-    assert len(rate_limiter._request_times[ip]) == 1
+    shard, _ = rate_limiter._get_request_shard(ip)
+    assert shard[ip].count == settings.MAX_REQUESTS_PER_MINUTE
+    assert rate_limiter.tracked_ip_count() == 1
 
-    # Clean old requests
-    rate_limiter._request_times[ip].append(now - 61)  # Old request
+    with pytest.raises(HTTPException) as exc_info:
+        rate_limiter.check_rate_limit(request)
+    assert exc_info.value.status_code == 429
 
-    # We need to call check_rate_limit to trigger cleanup, but that requires a request object
-    # Or we can test the cleanup logic if we extract it, but it's inside check_rate_limit
-    # Let's just verify the reset worked and we can access the internal state
+    # An expired window starts counting again
+    shard[ip].window_start -= 61 * 1_000_000_000
+    rate_limiter.check_rate_limit(request)
+    assert shard[ip].count == 1
 
     reset_rate_limits()
-    assert len(rate_limiter._request_times) == 0
+    assert rate_limiter.tracked_ip_count() == 0
+
+
+def test_client_ip_parsed_once_per_request():
+    from app.core.rate_limit import rate_limiter
+
+    scope = {
+        "type": "http",
+        "client": ("127.0.0.1", 12345),
+        "headers": [(b"x-forwarded-for", b" 203.0.113.7 , 10.0.0.1")],
+    }
+    request = Request(scope)
+
+    assert rate_limiter._get_client_ip(request) == "203.0.113.7"
+    # Later checks on the same request read the cached value
+    assert Request(scope).state.client_ip == "203.0.113.7"
@@ -76,6 +76,38 @@ class TestRedisClient:
             # Cleanup
             redis_delete(key)
 
+    def test_redis_mget_mset_cycle(self):
+        """Test batched set/get (works with or without Redis)."""
+        from app.core.redis_client import redis_delete, redis_mget, redis_mset
+
+        keys = ["test:batch:a", "test:batch:b"]
+        result = redis_mset({keys[0]: "1", keys[1]: "2"}, ttl=60)
+        assert isinstance(result, bool)
+
+        values = redis_mget(keys + ["test:batch:missing"])
+        assert list(values) == keys + ["test:batch:missing"]
+        assert values["test:batch:missing"] is None
+
+        if result:
+            assert values[keys[0]] == "1"
+            assert values[keys[1]] == "2"
+
+            # Cleanup
+            for key in keys:
+                redis_delete(key)
+
+    def test_redis_unlink_matching(self):
+        """Test pattern delete (works with or without Redis)."""
+        from app.core.redis_client import redis_get, redis_set, redis_unlink_matching
+
+        stored = redis_set("test:unlink:a", "1", ttl=60)
+        result = redis_unlink_matching("test:unlink:*")
+        assert isinstance(result, bool)
+
+        if stored:
+            assert result is True
+            assert redis_get("test:unlink:a") is None
+
 
 class TestCacheWithRedis:
     """Tests for cache module with Redis backend."""
@@ -46,6 +46,18 @@ def test_sitemap_has_lastmod(client: TestClient):
     assert "</lastmod>" in response.text
 
 
+def test_sitemap_is_rendered_once(client: TestClient):
+    """Test repeated sitemap requests reuse the rendered XML"""
+    from app.main import _render_sitemap
+
+    _render_sitemap.cache_clear()
+    first = client.get("/sitemap.xml")
+    second = client.get("/sitemap.xml")
+
+    assert first.content == second.content
+    assert _render_sitemap.cache_info().hits == 1
+
+
 def test_tool_page_has_seo_title(client: TestClient):
     """Test tool pages have custom SEO titles"""
     response = client.get("/tools/json-formatter/")
@@ -65,3 +65,165 @@ def test_pdf_merger_single_file_error(client):
     # Let's check router.py later. For now, assume it returns 200 OK with error message.
     assert response.status_code == 200
     assert "En az 2 PDF" in response.text
+
+
+def test_dice_notation_parsing():
+    from app.tools.dice_roller.router import DiceNotation, parse_dice_notation
+
+    assert parse_dice_notation("2d6+3") == DiceNotation(2, 6, None, None, 3)
+    assert parse_dice_notation("4D6KH3").keep_highest == 3
+    assert parse_dice_notation("4d6kl1-2").keep_lowest == 1
+    assert parse_dice_notation("4d6kl1-2").modifier == -2
+    assert parse_dice_notation("d20").count == 1
+    # Case and spacing variants share one cached parse
+    assert parse_dice_notation("1 D 20") is parse_dice_notation("1d20")
+
+    for invalid in (
+        "2d",
+        "d",
+        "2x6",
+        "2d6+",
+        "2d6+3+4",
+        "2d6k3",
+        "4d6kh5",
+        "2d6kh3kl1",
+        "2d٦",
+    ):
+        assert parse_dice_notation(invalid) is None, invalid
+
+
+def test_hash_generator_file_streams_all_algorithms(client):
+    import hashlib
+
+    content = b"x" * (3 * 1024 * 1024 + 17)  # spans several hashing chunks
+    files = {"file": ("data.bin", content, "application/octet-stream")}
+
+    response = client.post("/tools/hash-generator/file", files=files)
+    assert response.status_code == 200
+    assert hashlib.sha256(content).hexdigest() in response.text
+    assert hashlib.blake2b(content).hexdigest() in response.text
+    assert hashlib.md5(content).hexdigest() in response.text
+
+
+def test_hash_generator_file_mmap_path(client, monkeypatch):
+    import hashlib
+
+    from app.tools.hash_generator import router as hash_router
+
+    # Multipart uploads over 1 MB are spooled to disk, so this takes the mmap path
+    monkeypatch.setattr(hash_router, "_MMAP_MIN_SIZE", 1024 * 1024)
+    content = bytes(range(256)) * 9000
+    files = {"file": ("data.bin", content, "application/octet-stream")}
+
+    response = client.post(
+        "/tools/hash-generator/file", files=files, data={"algorithm": "sha512"}
+    )
+    assert response.status_code == 200
+    assert hashlib.sha512(content).hexdigest() in response.text
+
+
+def test_hash_generator_disk_fileno(tmp_path):
+    import io
+
+    from app.tools.hash_generator.router import _disk_fileno
+
+    assert _disk_fileno(io.BytesIO(b"data")) is None
+
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"")
+    with open(path, "rb") as f:
+        assert _disk_fileno(f) is None
+    path.write_bytes(b"data")
+    with open(path, "rb") as f:
+        assert _disk_fileno(f) == f.fileno()
+
+
+def test_hash_generator_blake3(client):
+    import blake3
+
+    response = client.post(
+        "/tools/hash-generator/text", data={"text": "merhaba", "algorithm": "blake3"}
+    )
+    assert response.status_code == 200
+    assert blake3.blake3(b"merhaba").hexdigest() in response.text
+
+
+def test_hash_generator_compare(client):
+    data = {"hash1": " ABCDEF0123 ", "hash2": "abcdef0123"}
+    response = client.post("/tools/hash-generator/compare", data=data)
+    assert response.status_code == 200
+    assert "Eşleşme!" in response.text
+
+    # Non-ASCII input is compared, not rejected
+    data = {"hash1": "çğü", "hash2": "ÇĞÜ"}
+    response = client.post("/tools/hash-generator/compare", data=data)
+    assert response.status_code == 200
+    assert "Bir hata oluştu" not in response.text
+
+
+def test_image_metadata_rejects_oversized_upload(client, monkeypatch):
+    from app.tools.image_metadata.router import tool_info
+
+    monkeypatch.setattr(tool_info, "max_upload_mb", 1)
+    content = b"\xff\xd8\xff" + b"\x00" * (1024 * 1024 + 1)
+    files = {"files": ("big.jpg", content, "image/jpeg")}
+
+    response = client.post("/tools/image-metadata/inspect", files=files)
+    assert response.status_code == 400
+    assert "Dosya boyutu çok büyük" in response.text
+
+
+def test_strip_metadata_keeps_pixels_and_palette():
+    import io
+
+    from PIL import Image
+
+    from app.core.image_utils import strip_metadata
+
+    exif = Image.Exif()
+    exif[0x010F] = "SecretCam"
+    src = io.BytesIO()
+    Image.new("RGB", (8, 8), (200, 10, 10)).save(src, "PNG", exif=exif)
+    img = Image.open(io.BytesIO(src.getvalue()))
+    assert "exif" in img.info
+
+    out = io.BytesIO()
+    strip_metadata(img).save(out, "PNG")
+    assert b"SecretCam" not in out.getvalue()
+    assert Image.open(out).getpixel((0, 0)) == (200, 10, 10)
+
+    paletted = Image.new("P", (4, 4), 3)
+    paletted.putpalette([0, 0, 0] * 3 + [10, 20, 30])
+    assert strip_metadata(paletted).convert("RGB").getpixel((0, 0)) == (10, 20, 30)
+
+
+def test_strip_metadata_drops_jpeg_comment():
+    import io
+
+    from PIL import Image
+
+    from app.core.image_utils import strip_metadata
+
+    src = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(src, "JPEG", comment=b"SecretComment")
+    img = Image.open(io.BytesIO(src.getvalue()))
+    assert img.info["comment"] == b"SecretComment"
+
+    out = io.BytesIO()
+    strip_metadata(img).save(out, "JPEG")
+    assert b"SecretComment" not in out.getvalue()
+
+
+def test_image_cropper_crops_upload(client):
+    import io
+
+    from PIL import Image
+
+    src = io.BytesIO()
+    Image.new("RGB", (20, 10), (0, 128, 255)).save(src, "PNG")
+    files = {"file": ("in.png", src.getvalue(), "image/png")}
+    data = {"width": "5", "height": "4", "x": "2", "y": "3"}
+
+    response = client.post("/tools/image-cropper/crop", files=files, data=data)
+    assert response.status_code == 200
+    assert Image.open(io.BytesIO(response.content)).size == (5, 4)